@@ -1,20 +1,55 @@
 #!/usr/bin/env python3
+import argparse
+import glob
+import hashlib
+import heapq
 import json
+import mmap
 import os
 import pickle
+import queue
 import re
+import shlex
 import shutil
-import tkinter as tk
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from tkinter import filedialog, messagebox, simpledialog, ttk
+from types import SimpleNamespace
+
+try:
+    import tkinter as tk
+    from tkinter import filedialog, messagebox, simpledialog, ttk
+    HAS_TKINTER = True
+except ImportError:
+    HAS_TKINTER = False
+    tk = ttk = SimpleNamespace(Frame=object, Toplevel=object)
+    filedialog = simpledialog = None
+    show_on_stderr = lambda title, message, **kwargs: print(f"{title}: {message}", file=sys.stderr)
+    messagebox = SimpleNamespace(showerror=show_on_stderr, showwarning=show_on_stderr, showinfo=show_on_stderr)
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+class BashrcLockTimeout(Exception):
+    pass
 
 class AliasData:
-    def __init__(self, alias="", command="", section="", description=""):
+    def __init__(self, alias="", command="", section="", description="", origin="", read_only=False):
         self.alias = alias
         self.command = command
         self.section = section
         self.description = description
+        self.origin = origin
+        self.read_only = read_only
 
     def __eq__(self, other):
         if not isinstance(other, AliasData):
@@ -22,20 +57,46 @@ class AliasData:
         return (self.alias == other.alias and
                 self.command == other.command and
                 self.section == other.section and
-                self.description == other.description)
+                self.description == other.description and
+                self.origin == other.origin and
+                self.read_only == other.read_only)
 
 class AliasManager:
-    def __init__(self, bashrc_path=None, descriptions_path=None):
+    DEFAULT_EXTRA_SOURCES = ("~/.bash_aliases", "/etc/profile.d/*.sh", "~/.zshrc")
+
+    def __init__(self, bashrc_path=None, descriptions_path=None, extra_sources=None, data_dir=None):
         self.bashrc_path = bashrc_path or os.path.expanduser("~/.bashrc")
-        self.script_dir = Path(os.path.dirname(os.path.abspath(__file__)))
+        self.extra_sources = list(self.DEFAULT_EXTRA_SOURCES if extra_sources is None else extra_sources)
+        self.script_dir = Path(data_dir) if data_dir else Path(os.path.dirname(os.path.abspath(__file__)))
         self.descriptions_path = descriptions_path or self.script_dir / "alias_descriptions.json"
         self.backups_dir = self.script_dir / "backups"
         self.settings_path = self.script_dir / "alias_manager_settings.pkl"
+        self.tags_path = self.script_dir / "alias_tags.json"
         self.backups_dir.mkdir(exist_ok=True)
         self.aliases = []
         self.sections = []
         self.descriptions = {}
+        self.tags = {}
+        self.pending_writes = None
+        self.rc_functions = {}
+        self.other_definitions = {}
+        self.source_loader = AliasSourceLoader()
+        self.lock_timeout = 5.0
+        self.last_lock_wait = 0.0
+        self.on_lock_wait = None
+        self.loaded_hash = None
+        self.base_aliases = {}
+        self.usage = {}
+        self.conflicts = {}
+        self.validation = {}
+        self.cycles = {}
+        self.dependencies = DependencyGraph()
+        self.history_analyzer = HistoryAnalyzer(self.script_dir / "alias_usage.json")
+        self.conflict_detector = ConflictDetector(ExecutableIndex(self.script_dir / "path_index.json"))
+        self.validator = CommandValidator(self.script_dir / "validation_cache.json")
+        self.sync = AliasSync(self.backups_dir / "sync_base.json")
         self.load_descriptions()
+        self.load_tags()
         self.load_aliases()
 
     def load_descriptions(self):
@@ -48,119 +109,490 @@ class AliasManager:
                 self.descriptions = {}
         else:
             self.descriptions = {}
+        self.base_descriptions = dict(self.descriptions)
 
     def save_descriptions(self):
-        with open(self.descriptions_path, 'w') as f:
-            json.dump(self.descriptions, f, indent=4)
+        if self.pending_writes is not None:
+            self.pending_writes.add("descriptions")
+            return
+        try:
+            with self.locked_file(self.descriptions_path, timeout=self.lock_timeout, report=self.report_lock_wait, mode='a+') as f:
+                f.seek(0)
+                try:
+                    theirs = json.loads(f.read() or "{}")
+                except json.JSONDecodeError:
+                    theirs = {}
+                self.merge_descriptions(theirs)
+                f.seek(0)
+                f.truncate()
+                json.dump(self.descriptions, f, indent=4)
+        except BashrcLockTimeout as e:
+            messagebox.showerror("Error", f"Failed to save descriptions: {str(e)}")
+            return False
+        self.base_descriptions = dict(self.descriptions)
+        return True
+
+    def merge_descriptions(self, theirs):
+        by_name = {a.alias: a for a in self.aliases}
+        for name in set(theirs) | set(self.base_descriptions):
+            base, other = self.base_descriptions.get(name), theirs.get(name)
+            if other == base or self.descriptions.get(name) != base:
+                continue
+            if other is None:
+                self.descriptions.pop(name, None)
+            else:
+                self.descriptions[name] = other
+            if name in by_name:
+                by_name[name].description = other or ""
+
+    def load_tags(self):
+        self.tags = {}
+        if os.path.exists(self.tags_path):
+            try:
+                with open(self.tags_path, 'r') as f:
+                    self.tags = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"Error loading tags: {e}")
+
+    def save_tags(self):
+        if self.pending_writes is not None:
+            self.pending_writes.add("tags")
+            return
+        with open(self.tags_path, 'w') as f:
+            json.dump(self.tags, f, indent=4)
+
+    def snapshot_state(self):
+        return {
+            "aliases": [AliasData(a.alias, a.command, a.section, a.description, a.origin, a.read_only) for a in self.aliases],
+            "sections": list(self.sections),
+            "descriptions": dict(self.descriptions),
+            "tags": {name: list(tags) for name, tags in self.tags.items()}
+        }
+
+    def restore_state(self, state):
+        self.aliases = state["aliases"]
+        self.sections = state["sections"]
+        self.descriptions = state["descriptions"]
+        self.tags = state["tags"]
+        self.dependencies.rebuild(self.aliases)
+
+    @contextmanager
+    def transaction(self):
+        if self.pending_writes is not None:
+            yield {"saved": True}
+            return
+        self.pending_writes = set()
+        outcome = {"saved": True}
+        state = self.snapshot_state()
+        try:
+            yield outcome
+        except BaseException:
+            self.pending_writes = None
+            self.restore_state(state)
+            raise
+        pending, self.pending_writes = self.pending_writes, None
+        if "bashrc" in pending:
+            outcome["saved"] = self.save_to_bashrc()
+            if not outcome["saved"]:
+                self.restore_state(state)
+                return
+        if "descriptions" in pending:
+            self.save_descriptions()
+        if "tags" in pending:
+            self.save_tags()
 
     def load_aliases(self):
         self.aliases = []
         self.sections = []
+        self.rc_functions = {}
+        self.other_definitions = {}
         try:
-            in_custom_aliases = False
-            current_section = ""
-            with open(self.bashrc_path, 'r') as f:
-                lines = f.readlines()
-            for line in lines:
-                line = line.strip()
-                if line == "# CUSTOM ALIASES":
-                    in_custom_aliases = True
-                    continue
-                elif line.startswith("# ") and in_custom_aliases:
-                    if not line.startswith("# ↓"):
-                        current_section = line[2:]
-                        if current_section not in self.sections:
-                            self.sections.append(current_section)
-                elif line.startswith("alias ") and in_custom_aliases:
-                    parts = line.split('=', 1)
-                    if len(parts) == 2:
-                        alias_name = parts[0].replace("alias ", "").strip()
-                        command = parts[1].strip()
-                        if (command.startswith("'") and command.endswith("'")) or (command.startswith('"') and command.endswith('"')):
-                            command = command[1:-1]
-                        description = self.descriptions.get(alias_name, "")
-                        alias_data = AliasData(alias_name, command, current_section, description)
-                        self.aliases.append(alias_data)
+            managed = []
+            external = {}
+            with self.bashrc_lock(shared=True) as f:
+                self.loaded_hash = hashlib.sha256(f.read()).hexdigest()
+                sources = self.source_loader.load(self.bashrc_path, self.extra_sources)
+            for path, parsed in sources:
+                origin = self.display_path(path)
+                for section in parsed["sections"]:
+                    if section not in self.sections:
+                        self.sections.append(section)
+                for name, line_number in parsed["functions"].items():
+                    self.rc_functions.setdefault(name, f"{origin} line {line_number}")
+                for name, command, section, line_number, is_managed in parsed["aliases"]:
+                    description = self.descriptions.get(name, "")
+                    if is_managed:
+                        managed.append(AliasData(name, command, section, description, origin))
+                        continue
+                    previous = external.get(name)
+                    if previous:
+                        self.other_definitions.setdefault(name, []).append(previous[1])
+                    external[name] = (AliasData(name, command, origin, description, origin, True), f"{origin} line {line_number}")
+            managed_names = {a.alias for a in managed}
+            self.aliases = managed
+            for name, (alias_data, location) in external.items():
+                if name in managed_names:
+                    self.other_definitions.setdefault(name, []).append(location)
+                else:
+                    self.aliases.append(alias_data)
+            self.base_aliases = self.snapshot_managed()
+            self.dependencies.rebuild(self.aliases)
+            self.update_conflicts()
+            self.cycles = self.dependencies.cycle_warnings()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load aliases from .bashrc: {str(e)}")
 
+    @contextmanager
+    def bashrc_lock(self, shared=False):
+        with self.locked_file(self.bashrc_path, shared, self.lock_timeout, self.report_lock_wait) as f:
+            yield f
+
+    @staticmethod
+    @contextmanager
+    def locked_file(path, shared=False, timeout=5.0, report=None, mode='rb'):
+        started = time.monotonic()
+        f = open(path, mode)
+        try:
+            if fcntl is not None:
+                operation = (fcntl.LOCK_SH if shared else fcntl.LOCK_EX) | fcntl.LOCK_NB
+                while True:
+                    try:
+                        fcntl.flock(f.fileno(), operation)
+                    except BlockingIOError:
+                        if time.monotonic() - started >= timeout:
+                            if report:
+                                report(time.monotonic() - started, True)
+                            raise BashrcLockTimeout(f"{path} is locked by another process (waited {timeout:.1f}s)")
+                        time.sleep(0.05)
+                        continue
+                    if os.fstat(f.fileno()).st_ino == os.stat(path).st_ino:
+                        break
+                    f.close()
+                    f = open(path, mode)
+            if report:
+                report(time.monotonic() - started, False)
+            yield f
+        finally:
+            f.close()
+
+    def report_lock_wait(self, seconds, timed_out):
+        self.last_lock_wait = seconds
+        if self.on_lock_wait:
+            self.on_lock_wait(seconds, timed_out)
+
+    def snapshot_managed(self):
+        return {a.alias: (a.command, a.section) for a in self.managed_aliases()}
+
+    def merge_external_changes(self, lines):
+        theirs = {}
+        for name, command, section, _, is_managed in AliasSourceLoader.parse([line.rstrip("\n") for line in lines])["aliases"]:
+            if is_managed:
+                theirs[name] = (command, section)
+        ours = self.snapshot_managed()
+        changes = {}
+        conflicts = []
+        for name in set(ours) | set(theirs) | set(self.base_aliases):
+            base, mine, other = self.base_aliases.get(name), ours.get(name), theirs.get(name)
+            if mine == other or other == base:
+                continue
+            if mine == base:
+                changes[name] = other
+            else:
+                conflicts.append(name)
+        if conflicts:
+            return sorted(conflicts)
+        by_name = {a.alias: a for a in self.managed_aliases()}
+        for name, value in changes.items():
+            alias = by_name.get(name)
+            if value is None:
+                self.aliases.remove(alias)
+                self.dependencies.remove(name)
+                continue
+            command, section = value
+            if alias is None:
+                alias = AliasData(name, command, section, self.descriptions.get(name, ""), self.display_path(os.path.abspath(self.bashrc_path)))
+                self.aliases.append(alias)
+            alias.command = command
+            alias.section = section
+            if section not in self.sections:
+                self.sections.append(section)
+            self.dependencies.update(name, command)
+        return []
+
+    @staticmethod
+    def display_path(path):
+        home = os.path.expanduser("~")
+        if path == home or path.startswith(home + os.sep):
+            return "~" + path[len(home):]
+        return path
+
+    def managed_aliases(self):
+        return [a for a in self.aliases if not a.read_only]
+
+    @staticmethod
+    def quote_command(command):
+        if "'" not in command:
+            return f"'{command}'"
+        if not any(ch in command for ch in '"$`\\'):
+            return f'"{command}"'
+        return "'" + command.replace("'", "'\\''") + "'"
+
+    @staticmethod
+    def parse_command_value(value):
+        try:
+            words = shlex.split(value, comments=True)
+        except ValueError:
+            words = []
+        if len(words) == 1:
+            return words[0]
+        if (value.startswith("'") and value.endswith("'")) or (value.startswith('"') and value.endswith('"')):
+            return value[1:-1]
+        return value
+
+    @classmethod
+    def render_alias(cls, alias_data):
+        return f"alias {alias_data.alias}={cls.quote_command(alias_data.command)}"
+
     def add_alias(self, alias_data):
+        state = self.snapshot_state()
+        if not alias_data.origin:
+            alias_data.origin = self.display_path(os.path.abspath(self.bashrc_path))
         self.aliases.append(alias_data)
         if alias_data.section not in self.sections:
             self.sections.append(alias_data.section)
         self.descriptions[alias_data.alias] = alias_data.description
-        self.save_to_bashrc()
+        self.dependencies.update(alias_data.alias, alias_data.command)
+        if not self.save_to_bashrc():
+            self.restore_state(state)
+            return False
         self.save_descriptions()
         return True
 
-    def update_alias(self, old_alias, alias_data):
+    def update_alias(self, old_alias, alias_data, rewrite_dependents=False):
+        state = self.snapshot_state()
+        if not alias_data.origin:
+            alias_data.origin = self.display_path(os.path.abspath(self.bashrc_path))
         for i, a in enumerate(self.aliases):
             if a.alias == old_alias:
+                if a.read_only:
+                    messagebox.showerror("Error", f"Alias '{old_alias}' comes from {a.origin} and is read-only")
+                    return False
                 if old_alias != alias_data.alias and old_alias in self.descriptions:
                     del self.descriptions[old_alias]
+                if old_alias != alias_data.alias and old_alias in self.tags:
+                    self.tags[alias_data.alias] = self.tags.pop(old_alias)
                 self.aliases[i] = alias_data
                 self.descriptions[alias_data.alias] = alias_data.description
                 if alias_data.section not in self.sections:
                     self.sections.append(alias_data.section)
                 break
-        self.save_to_bashrc()
+        if old_alias != alias_data.alias:
+            if rewrite_dependents:
+                self.rewrite_dependents(old_alias, alias_data.alias)
+            self.dependencies.remove(old_alias)
+        self.dependencies.update(alias_data.alias, alias_data.command)
+        if not self.save_to_bashrc():
+            self.restore_state(state)
+            return False
         self.save_descriptions()
+        if self.tags != state["tags"]:
+            self.save_tags()
         return True
 
-    def delete_alias(self, alias_name):
+    def delete_alias(self, alias_name, inline_dependents=False):
+        deleted = next((a for a in self.aliases if a.alias == alias_name), None)
+        if deleted and deleted.read_only:
+            messagebox.showerror("Error", f"Alias '{alias_name}' comes from {deleted.origin} and is read-only")
+            return False
+        state = self.snapshot_state()
+        if inline_dependents and deleted:
+            self.rewrite_dependents(alias_name, deleted.command)
         self.aliases = [a for a in self.aliases if a.alias != alias_name]
         if alias_name in self.descriptions:
             del self.descriptions[alias_name]
+        self.tags.pop(alias_name, None)
+        self.dependencies.remove(alias_name)
+        if not self.save_to_bashrc():
+            self.restore_state(state)
+            return False
+        self.save_descriptions()
+        if self.tags != state["tags"]:
+            self.save_tags()
+        return True
+
+    def apply_alias_changes(self, changes):
+        with self.transaction() as outcome:
+            self.stage_alias_changes(changes)
+        return outcome["saved"]
+
+    def stage_alias_changes(self, changes):
+        by_name = {a.alias: a for a in self.aliases}
+        origin = self.display_path(os.path.abspath(self.bashrc_path))
+        removed = set()
+        for name, entry in changes.items():
+            alias = by_name.get(name)
+            if alias is not None and alias.read_only:
+                continue
+            if entry is None:
+                if alias:
+                    removed.add(name)
+                self.descriptions.pop(name, None)
+                if self.tags.pop(name, None) is not None:
+                    self.save_tags()
+                self.dependencies.remove(name)
+                continue
+            description = entry.get("description", "")
+            if alias is None:
+                alias = AliasData(name, entry["command"], entry["section"], description, origin)
+                self.aliases.append(alias)
+                by_name[name] = alias
+            alias.command = entry["command"]
+            alias.section = entry["section"]
+            alias.description = description
+            self.descriptions[name] = description
+            if alias.section not in self.sections:
+                self.sections.append(alias.section)
+            self.dependencies.update(name, alias.command)
+        if removed:
+            self.aliases = [a for a in self.aliases if a.read_only or a.alias not in removed]
         self.save_to_bashrc()
         self.save_descriptions()
+
+    def editable_aliases(self, names):
+        wanted = set(names)
+        return [a for a in self.managed_aliases() if a.alias in wanted]
+
+    def move_aliases(self, names, section):
+        return self.apply_alias_changes({a.alias: dict(AliasSync.entry(a), section=section) for a in self.editable_aliases(names)})
+
+    def delete_aliases(self, names):
+        return self.apply_alias_changes({a.alias: None for a in self.editable_aliases(names)})
+
+    def tag_aliases(self, names, add=(), remove=()):
+        for name in names:
+            tags = [t for t in self.tags.get(name, []) if t not in remove]
+            tags.extend(t for t in add if t not in tags)
+            if tags:
+                self.tags[name] = tags
+            else:
+                self.tags.pop(name, None)
+        self.save_tags()
         return True
 
+    def replace_in_commands(self, names, find, replace, use_regex=False):
+        pattern = re.compile(find if use_regex else re.escape(find))
+        replacement = replace if use_regex else (lambda match: replace)
+        changes = {}
+        for alias in self.editable_aliases(names):
+            command = pattern.sub(replacement, alias.command)
+            if command != alias.command:
+                changes[alias.alias] = dict(AliasSync.entry(alias), command=command)
+        if not changes:
+            return True
+        return self.apply_alias_changes(changes)
+
+    def dependents(self, alias_name):
+        return self.dependencies.dependents(alias_name)
+
+    def rewrite_dependents(self, alias_name, replacement):
+        by_name = {a.alias: a for a in self.aliases}
+        for name in self.dependencies.dependents(alias_name):
+            alias = by_name.get(name)
+            if alias is None or alias.read_only or name == alias_name:
+                continue
+            alias.command = DependencyGraph.rewrite_references(alias.command, alias_name, replacement)
+            self.dependencies.update(name, alias.command)
+
     def save_to_bashrc(self):
-        try:
-            with open(self.bashrc_path, 'r') as f:
-                lines = f.readlines()
-            start_idx = -1
-            for i, line in enumerate(lines):
-                if line.strip() == "# CUSTOM ALIASES":
-                    start_idx = i
-                    break
-            if start_idx == -1:
-                messagebox.showerror("Error", "Section # CUSTOM ALIASES not found in .bashrc")
-                return False
-            new_content = lines[:start_idx+1]
-            new_content.append("\n")
-            aliases_by_section = {}
-            for a in self.aliases:
-                if a.section not in aliases_by_section:
-                    aliases_by_section[a.section] = []
-                aliases_by_section[a.section].append(a)
-            sorted_sections = sorted(aliases_by_section.keys())
-            for section in sorted_sections:
-                new_content.append(f"# {section}\n")
-                section_aliases = sorted(aliases_by_section[section], key=lambda x: x.alias)
-                for a in section_aliases:
-                    if "'" in a.command:
-                        new_content.append(f'alias {a.alias}="{a.command}"\n')
-                    else:
-                        new_content.append(f"alias {a.alias}='{a.command}'\n")
-                new_content.append("\n")
-            found_end = False
-            for i in range(len(lines) - 1, start_idx, -1):
-                if lines[i].strip().startswith("alias "):
-                    end_idx = i + 1
-                    found_end = True
-                    break
-            if found_end:
-                for i in range(end_idx, len(lines)):
-                    if lines[i].strip() and not lines[i].strip().startswith("alias ") and not lines[i].strip().startswith("# "):
-                        new_content.extend(lines[i:])
-                        break
-            with open(self.bashrc_path, 'w') as f:
-                f.writelines(new_content)
+        if self.pending_writes is not None:
+            self.pending_writes.add("bashrc")
             return True
+        try:
+            with self.bashrc_lock() as lock_file:
+                conflicts = self.write_bashrc(lock_file)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save aliases to .bashrc: {str(e)}")
             return False
+        if conflicts is None:
+            messagebox.showerror("Error", "Section # CUSTOM ALIASES not found in .bashrc")
+            return False
+        if conflicts:
+            messagebox.showerror("Conflict", ".bashrc was changed by another program and these aliases were modified on both sides:\n\n" + ", ".join(conflicts) + "\n\nRefresh to load the other changes, then reapply yours.")
+            return False
+        self.update_conflicts()
+        self.cycles = self.dependencies.cycle_warnings()
+        return True
+
+    def write_bashrc(self, lock_file):
+        content = lock_file.read()
+        if self.loaded_hash and hashlib.sha256(content).hexdigest() != self.loaded_hash:
+            conflicts = self.merge_external_changes(content.decode("utf-8", "replace").splitlines(True))
+            if conflicts:
+                return conflicts
+        lines = content.decode("utf-8", "replace").splitlines(True)
+        new_content = self.render_bashrc(lines, self.managed_aliases())
+        if new_content is None:
+            return None
+        data = "".join(new_content).encode("utf-8")
+        with open(self.bashrc_path, 'wb') as f:
+            f.write(data)
+        self.loaded_hash = hashlib.sha256(data).hexdigest()
+        self.base_aliases = self.snapshot_managed()
+        return []
+
+    @classmethod
+    def render_bashrc(cls, lines, aliases):
+        start_idx = -1
+        for i, line in enumerate(lines):
+            if line.strip() == "# CUSTOM ALIASES":
+                start_idx = i
+                break
+        if start_idx == -1:
+            return None
+        new_content = lines[:start_idx+1]
+        new_content.append("\n")
+        aliases_by_section = {}
+        for a in aliases:
+            if a.section not in aliases_by_section:
+                aliases_by_section[a.section] = []
+            aliases_by_section[a.section].append(a)
+        sorted_sections = sorted(aliases_by_section.keys())
+        for section in sorted_sections:
+            new_content.append(f"# {section}\n")
+            section_aliases = sorted(aliases_by_section[section], key=lambda x: x.alias)
+            for a in section_aliases:
+                new_content.append(cls.render_alias(a) + "\n")
+            new_content.append("\n")
+        found_end = False
+        for i in range(len(lines) - 1, start_idx, -1):
+            if lines[i].strip().startswith("alias "):
+                end_idx = i + 1
+                found_end = True
+                break
+        if found_end:
+            for i in range(end_idx, len(lines)):
+                if lines[i].strip() and not lines[i].strip().startswith("alias ") and not lines[i].strip().startswith("# "):
+                    new_content.extend(lines[i:])
+                    break
+        return new_content
+
+    def update_conflicts(self):
+        self.conflicts = self.conflict_detector.scan(self.aliases, self.rc_functions, self.other_definitions)
+        return self.conflicts
+
+    def check_alias_conflicts(self, alias_name, old_alias=None):
+        others = [a for a in self.aliases if a.alias != old_alias]
+        return self.conflict_detector.check(alias_name, others, self.rc_functions, self.other_definitions)
+
+    def conflict_report(self):
+        conflicts = self.update_conflicts()
+        if not conflicts:
+            return "No conflicts found."
+        report = [f"{len(conflicts)} of {len(self.aliases)} aliases have conflicts:", ""]
+        for name in sorted(conflicts):
+            report.append(f"{name}:")
+            report.extend(f"    - {warning}" for warning in conflicts[name])
+        return "\n".join(report)
 
     def add_section(self, section_name):
         if section_name not in self.sections:
@@ -172,7 +604,7 @@ class AliasManager:
         if new_name in self.sections:
             return False
         self.sections = [new_name if s == old_name else s for s in self.sections]
-        for alias in self.aliases:
+        for alias in self.managed_aliases():
             if alias.section == old_name:
                 alias.section = new_name
         self.save_to_bashrc()
@@ -186,8 +618,9 @@ class AliasManager:
             return True
         return False
 
-    def export_aliases(self, filepath):
+    def export_aliases(self, filepath, names=None):
         try:
+            aliases = self.managed_aliases() if names is None else self.editable_aliases(names)
             data = {
                 "aliases": [
                     {
@@ -196,9 +629,10 @@ class AliasManager:
                         "section": a.section,
                         "description": a.description
                     }
-                    for a in self.aliases
+                    for a in aliases
                 ],
-                "sections": self.sections
+                "sections": self.sections if names is None else sorted({a.section for a in aliases}),
+                "hashes": AliasSync.build_tree([AliasSync.entry(a) for a in aliases])[0]
             }
             os.makedirs(os.path.dirname(filepath), exist_ok=True)
             with open(filepath, 'w') as f:
@@ -212,31 +646,55 @@ class AliasManager:
         try:
             with open(filepath, 'r') as f:
                 data = json.load(f)
-            if overwrite:
-                self.aliases = []
-                self.descriptions = {}
-                self.sections = []
-            for section in data.get("sections", []):
-                if section not in self.sections:
-                    self.sections.append(section)
-            for alias_data in data.get("aliases", []):
-                alias = alias_data["alias"]
-                command = alias_data["command"]
-                section = alias_data["section"]
-                description = alias_data.get("description", "")
-                existing = next((a for a in self.aliases if a.alias == alias), None)
-                if existing:
-                    if overwrite:
-                        self.update_alias(alias, AliasData(alias, command, section, description))
-                else:
-                    self.add_alias(AliasData(alias, command, section, description))
-            self.save_to_bashrc()
-            self.save_descriptions()
-            return True
+            with self.transaction() as outcome:
+                changes = {}
+                if overwrite:
+                    changes = {a.alias: None for a in self.managed_aliases()}
+                    self.sections = []
+                for section in data.get("sections", []):
+                    if section not in self.sections:
+                        self.sections.append(section)
+                existing = {a.alias for a in self.aliases if a.read_only or not overwrite}
+                for alias_data in data.get("aliases", []):
+                    alias = alias_data["alias"]
+                    if alias in existing or (alias in changes and not overwrite):
+                        continue
+                    changes[alias] = AliasSync.entry(alias_data)
+                self.stage_alias_changes(changes)
+            return outcome["saved"]
         except Exception as e:
             messagebox.showerror("Import Error", f"Failed to import aliases: {str(e)}")
             return False
 
+    def sync_entries(self):
+        return [AliasSync.entry(a) for a in self.managed_aliases()]
+
+    def plan_sync(self, remote_path):
+        try:
+            return self.sync.plan(self.sync_entries(), AliasSync.open_remote(remote_path))
+        except Exception as e:
+            messagebox.showerror("Sync Error", f"Failed to compare aliases with {remote_path}: {str(e)}")
+            return None
+
+    def apply_sync(self, plan):
+        try:
+            if plan["pull"] and not self.apply_alias_changes({name: theirs for name, (_, theirs) in plan["pull"].items()}):
+                return False
+            self.sync.apply_remote(plan)
+            self.sync.record_base(plan, self.sync_entries())
+            return True
+        except Exception as e:
+            messagebox.showerror("Sync Error", f"Failed to sync aliases: {str(e)}")
+            return False
+
+    def record_sync_base(self, plan):
+        try:
+            self.sync.record_base(plan, self.sync_entries())
+            return True
+        except Exception as e:
+            print(f"Error saving sync base: {e}")
+            return False
+
     def backup_bashrc(self):
         try:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -259,6 +717,1183 @@ class AliasManager:
             messagebox.showerror("Backup Error", f"Failed to create backup of descriptions: {str(e)}")
             return None
 
+    def analyze_history(self, history_paths=None):
+        if history_paths is not None:
+            self.history_analyzer.history_paths = list(history_paths)
+        return self.history_analyzer.analyze([a.alias for a in self.aliases])
+
+    def validate_aliases(self, aliases=None):
+        if aliases is None:
+            aliases = list(self.aliases)
+        known = set(self.conflict_detector.executables()) | set(self.rc_functions) | set(self.other_definitions) | {a.alias for a in self.aliases}
+        return self.validator.validate(aliases, known)
+
+    def suggest_aliases(self, history_paths, limit=20):
+        reserved = set(self.conflict_detector.executables()) | set(ConflictDetector.BASH_BUILTINS) | set(ConflictDetector.BASH_KEYWORDS) | set(self.rc_functions) | set(self.other_definitions)
+        return AliasSuggester(list(self.aliases), reserved).suggest(history_paths, limit)
+
+class AliasSourceLoader:
+    CUSTOM_ALIASES_MARKER = "# CUSTOM ALIASES"
+    INCLUDE_PATTERN = re.compile(r"(?:^|[;&|{]\s*|\b(?:then|do|else)\s+)(?:source|\.)\s+(\"[^\"]+\"|'[^']+'|[^\s;&|)]+)")
+    FUNCTION_PATTERN = re.compile(r"^\s*(?:function\s+([^\s(){}]+)\s*(?:\(\s*\))?|([^\s(){}=#$]+)\s*\(\s*\))\s*(?:\{|$)")
+
+    def __init__(self):
+        self.cache = {}
+
+    def load(self, primary_path, extra_sources=()):
+        results = []
+        visited = set()
+        self.visit(os.path.abspath(primary_path), True, results, visited)
+        for pattern in extra_sources:
+            for path in self.expand(pattern, os.path.expanduser("~")):
+                self.visit(path, False, results, visited)
+        return results
+
+    def visit(self, path, primary, results, visited):
+        real_path = os.path.realpath(path)
+        if real_path in visited:
+            return
+        visited.add(real_path)
+        try:
+            parsed = self.parse_cached(path, primary)
+        except OSError:
+            if primary:
+                raise
+            return
+        results.append((path, parsed))
+        for include in parsed["includes"]:
+            for target in self.expand(include, os.path.expanduser("~")):
+                self.visit(target, False, results, visited)
+
+    @staticmethod
+    def expand(pattern, base_dir):
+        pattern = pattern.strip("'\"")
+        home = os.path.expanduser("~")
+        pattern = pattern.replace("${HOME}", home).replace("$HOME", home)
+        if "$" in pattern or "`" in pattern:
+            return []
+        pattern = os.path.join(base_dir, os.path.expanduser(pattern))
+        if any(ch in pattern for ch in "*?["):
+            return sorted(glob.glob(pattern))
+        return [pattern] if os.path.isfile(pattern) else []
+
+    def parse_cached(self, path, primary):
+        stat = os.stat(path)
+        key = (path, primary)
+        entry = self.cache.get(key)
+        if entry and entry["mtime"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            return entry["parsed"]
+        with open(path, 'rb') as f:
+            data = f.read()
+        digest = hashlib.sha1(data).hexdigest()
+        if entry and entry["hash"] == digest:
+            entry["mtime"] = stat.st_mtime_ns
+            return entry["parsed"]
+        parsed = self.parse(data.decode("utf-8", "replace").splitlines(), primary)
+        self.cache[key] = {"mtime": stat.st_mtime_ns, "size": stat.st_size, "hash": digest, "parsed": parsed}
+        return parsed
+
+    @classmethod
+    def parse(cls, lines, primary=True):
+        aliases = []
+        sections = []
+        includes = []
+        functions = {}
+        in_custom_aliases = False
+        current_section = ""
+        for number, raw_line in enumerate(lines, 1):
+            line = raw_line.strip()
+            if primary and line == cls.CUSTOM_ALIASES_MARKER:
+                in_custom_aliases = True
+                continue
+            if primary and in_custom_aliases and line.startswith("# "):
+                if not line.startswith("# ↓"):
+                    current_section = line[2:]
+                    if current_section not in sections:
+                        sections.append(current_section)
+                continue
+            if line.startswith("alias ") and not line.startswith("alias -"):
+                parts = line.split('=', 1)
+                if len(parts) == 2:
+                    alias_name = parts[0].replace("alias ", "").strip()
+                    command = AliasManager.parse_command_value(parts[1].strip())
+                    managed = primary and in_custom_aliases
+                    aliases.append((alias_name, command, current_section if managed else "", number, managed))
+                continue
+            if line.startswith("#"):
+                continue
+            match = cls.FUNCTION_PATTERN.match(line)
+            if match:
+                functions.setdefault(match.group(1) or match.group(2), number)
+            includes.extend(m.group(1) for m in cls.INCLUDE_PATTERN.finditer(line))
+        return {"aliases": aliases, "sections": sections, "includes": includes, "functions": functions}
+
+class FleetScanner:
+    def __init__(self, max_workers=None, rc_name=".bashrc", descriptions_name=None, progress=None, batch_size=32, lock_timeout=5.0):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.lock_timeout = lock_timeout
+        self.rc_name = rc_name
+        self.descriptions_name = descriptions_name
+        self.progress = progress
+        self.stats = {}
+
+    def discover(self, home_root):
+        homes = []
+        with os.scandir(home_root) as entries:
+            for entry in entries:
+                rc_path = os.path.join(entry.path, self.rc_name)
+                if entry.is_dir(follow_symlinks=False) and os.path.isfile(rc_path):
+                    descriptions_path = os.path.join(entry.path, self.descriptions_name) if self.descriptions_name else None
+                    homes.append((entry.name, rc_path, descriptions_path))
+        return sorted(homes)
+
+    @staticmethod
+    def scan_file(task):
+        user, rc_path, descriptions_path = task
+        try:
+            with open(rc_path, 'rb') as f:
+                data = f.read()
+            parsed = AliasSourceLoader.parse(data.decode("utf-8", "replace").splitlines(), True)
+            descriptions = {}
+            if descriptions_path and os.path.exists(descriptions_path):
+                with open(descriptions_path, 'r') as f:
+                    descriptions = json.load(f)
+            aliases = [(name, command, section, descriptions.get(name, "")) for name, command, section, _, managed in parsed["aliases"] if managed]
+            return {"user": user, "path": rc_path, "bytes": len(data), "aliases": aliases, "error": None}
+        except (OSError, ValueError) as e:
+            return {"user": user, "path": rc_path, "bytes": 0, "aliases": [], "error": str(e)}
+
+    @staticmethod
+    def patch_file(task):
+        user, rc_path, patch, lock_timeout = task
+        try:
+            target = os.path.realpath(rc_path)
+            home = os.path.realpath(os.path.dirname(rc_path))
+            if os.path.commonpath([home, target]) != home:
+                return {"user": user, "path": rc_path, "bytes": 0, "changed": False, "error": f"symlink to {target} outside the home directory, skipped"}
+            with AliasManager.locked_file(target, timeout=lock_timeout) as f:
+                data = f.read()
+                lines = data.decode("utf-8", "replace").splitlines(True)
+                parsed = AliasSourceLoader.parse([line.rstrip("\n") for line in lines], True)
+                aliases = {name: AliasData(name, command, section) for name, command, section, _, managed in parsed["aliases"] if managed}
+                before = {name: (a.command, a.section) for name, a in aliases.items()}
+                for name in patch.get("delete", []):
+                    aliases.pop(name, None)
+                for entry in patch.get("set", []):
+                    current = aliases.get(entry["alias"])
+                    section = entry.get("section") or (current.section if current else "Fleet")
+                    aliases[entry["alias"]] = AliasData(entry["alias"], entry["command"], section)
+                if before == {name: (a.command, a.section) for name, a in aliases.items()}:
+                    return {"user": user, "path": rc_path, "bytes": len(data), "changed": False, "error": None}
+                new_content = AliasManager.render_bashrc(lines, list(aliases.values()))
+                if new_content is None:
+                    return {"user": user, "path": rc_path, "bytes": len(data), "changed": False, "error": "Section # CUSTOM ALIASES not found"}
+                FleetScanner.atomic_write(target, "".join(new_content).encode("utf-8"))
+            return {"user": user, "path": rc_path, "bytes": len(data), "changed": True, "error": None}
+        except (OSError, ValueError, KeyError, BashrcLockTimeout) as e:
+            return {"user": user, "path": rc_path, "bytes": 0, "changed": False, "error": str(e)}
+
+    @staticmethod
+    def atomic_write(path, data):
+        stat = os.stat(path)
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".alias_manager_")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.chmod(temp_path, stat.st_mode & 0o7777)
+            try:
+                os.chown(temp_path, stat.st_uid, stat.st_gid)
+            except PermissionError:
+                pass
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+    @staticmethod
+    def run_batch(func, tasks):
+        return [func(task) for task in tasks]
+
+    def run(self, func, tasks, label):
+        results = []
+        started = time.monotonic()
+        last_report = 0.0
+        total_bytes = 0
+        tasks = list(tasks)
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(self.run_batch, func, tasks[i:i + self.batch_size]) for i in range(0, len(tasks), self.batch_size)]
+            for future in as_completed(futures):
+                for result in future.result():
+                    results.append(result)
+                    total_bytes += result["bytes"]
+                now = time.monotonic()
+                if self.progress and (now - last_report >= 0.5 or len(results) == len(tasks)):
+                    last_report = now
+                    elapsed = max(now - started, 1e-9)
+                    self.progress(label, len(results), len(tasks), len(results) / elapsed, total_bytes / elapsed)
+        elapsed = time.monotonic() - started
+        self.stats[label] = {
+            "files": len(results),
+            "errors": sum(1 for r in results if r["error"]),
+            "bytes": total_bytes,
+            "seconds": elapsed,
+            "files_per_second": len(results) / elapsed if elapsed else 0.0,
+            "bytes_per_second": total_bytes / elapsed if elapsed else 0.0
+        }
+        return results
+
+    def scan(self, homes):
+        results = self.run(self.scan_file, homes, "scan")
+        index = {}
+        for result in results:
+            for name, command, section, description in result["aliases"]:
+                entry = index.setdefault(name, {"users": [], "commands": {}, "sections": [], "descriptions": []})
+                entry["users"].append(result["user"])
+                entry["commands"].setdefault(command, []).append(result["user"])
+                if section not in entry["sections"]:
+                    entry["sections"].append(section)
+                if description and description not in entry["descriptions"]:
+                    entry["descriptions"].append(description)
+        for entry in index.values():
+            entry["users"].sort()
+            entry["sections"].sort()
+        return index, results
+
+    def apply_patch(self, homes, patch):
+        return self.run(self.patch_file, [(user, rc_path, patch, self.lock_timeout) for user, rc_path, _ in homes], "patch")
+
+class SyncExportFile:
+    def __init__(self, path):
+        self.path = os.path.abspath(path)
+        self.data = {"aliases": [], "sections": []}
+        if os.path.exists(self.path):
+            with open(self.path, 'r') as f:
+                self.data = json.load(f)
+        self.entries = [AliasSync.entry(e) for e in self.data.get("aliases", [])]
+
+    def tree(self):
+        return AliasSync.build_tree(self.entries)[0]
+
+    def section_entries(self, section):
+        return [e for e in self.entries if e["section"] == section]
+
+    def write_sections(self, changed):
+        entries = [e for e in self.entries if e["section"] not in changed]
+        for section_entries in changed.values():
+            entries.extend(section_entries)
+        entries.sort(key=lambda e: (e["section"], e["alias"]))
+        sections = list(self.data.get("sections", []))
+        for section in changed:
+            if changed[section] and section not in sections:
+                sections.append(section)
+        self.data["aliases"] = entries
+        self.data["sections"] = sections
+        self.data["hashes"] = AliasSync.build_tree(entries)[0]
+        self.entries = entries
+        AliasSync.write_json(self.path, self.data)
+
+class SyncDirectory:
+    MANIFEST_NAME = "manifest.json"
+
+    def __init__(self, path):
+        self.path = os.path.abspath(path)
+        self.manifest = {"root": AliasSync.digest(), "sections": {}}
+        manifest_path = os.path.join(self.path, self.MANIFEST_NAME)
+        if os.path.exists(manifest_path):
+            with open(manifest_path, 'r') as f:
+                self.manifest = json.load(f)
+
+    @staticmethod
+    def section_file(section):
+        return os.path.join("sections", hashlib.sha1(section.encode("utf-8")).hexdigest()[:16] + ".json")
+
+    def tree(self):
+        return {"root": self.manifest["root"], "sections": dict(self.manifest["sections"])}
+
+    def section_entries(self, section):
+        with open(os.path.join(self.path, self.section_file(section)), 'r') as f:
+            return [AliasSync.entry(e) for e in json.load(f)["aliases"]]
+
+    def write_sections(self, changed):
+        os.makedirs(os.path.join(self.path, "sections"), exist_ok=True)
+        sections = self.manifest["sections"]
+        for section, entries in changed.items():
+            path = os.path.join(self.path, self.section_file(section))
+            if not entries:
+                sections.pop(section, None)
+                if os.path.exists(path):
+                    os.unlink(path)
+                continue
+            entries = sorted(entries, key=lambda e: e["alias"])
+            AliasSync.write_json(path, {"section": section, "aliases": entries})
+            sections[section] = AliasSync.section_hash({e["alias"]: AliasSync.alias_hash(e) for e in entries})
+        self.manifest["root"] = AliasSync.root_hash(sections)
+        AliasSync.write_json(os.path.join(self.path, self.MANIFEST_NAME), self.manifest)
+
+class AliasSync:
+    def __init__(self, base_path):
+        self.base_path = base_path
+
+    @staticmethod
+    def entry(alias):
+        if isinstance(alias, AliasData):
+            return {"alias": alias.alias, "command": alias.command, "section": alias.section, "description": alias.description}
+        return {"alias": alias["alias"], "command": alias["command"], "section": alias["section"], "description": alias.get("description", "")}
+
+    @staticmethod
+    def digest(*parts):
+        h = hashlib.sha256()
+        for part in parts:
+            h.update(part.encode("utf-8"))
+            h.update(b"\0")
+        return h.hexdigest()
+
+    @classmethod
+    def alias_hash(cls, entry):
+        return cls.digest(entry["alias"], entry["command"], entry["section"], entry["description"])
+
+    @classmethod
+    def section_hash(cls, alias_hashes):
+        return cls.digest(*(f"{name}={h}" for name, h in sorted(alias_hashes.items())))
+
+    @classmethod
+    def root_hash(cls, section_hashes):
+        return cls.digest(*(f"{section}={h}" for section, h in sorted(section_hashes.items())))
+
+    @classmethod
+    def build_tree(cls, entries):
+        sections = {}
+        for entry in entries:
+            sections.setdefault(entry["section"], {})[entry["alias"]] = cls.alias_hash(entry)
+        section_hashes = {section: cls.section_hash(hashes) for section, hashes in sections.items()}
+        return {"root": cls.root_hash(section_hashes), "sections": section_hashes}, sections
+
+    @staticmethod
+    def write_json(path, data):
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".alias_manager_")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f, indent=4)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+    @staticmethod
+    def open_remote(path):
+        if os.path.isdir(path) or not path.endswith(".json"):
+            return SyncDirectory(path)
+        return SyncExportFile(path)
+
+    def load_bases(self):
+        if os.path.exists(self.base_path):
+            try:
+                with open(self.base_path, 'r') as f:
+                    return json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"Error loading sync base: {e}")
+        return {}
+
+    def save_base(self, remote, entries):
+        bases = self.load_bases()
+        bases[remote.path] = entries
+        self.write_json(self.base_path, bases)
+
+    def plan(self, local_entries, remote):
+        local_tree, local_sections = self.build_tree(local_entries)
+        remote_tree = remote.tree()
+        plan = {"remote": remote, "local_root": local_tree["root"], "remote_root": remote_tree["root"], "sections": [], "remote_sections": {}, "pull": {}, "push": {}, "conflicts": {}, "total_sections": len(set(local_tree["sections"]) | set(remote_tree["sections"]))}
+        if local_tree["root"] == remote_tree["root"]:
+            return plan
+        plan["sections"] = sorted(s for s in set(local_tree["sections"]) | set(remote_tree["sections"]) if local_tree["sections"].get(s) != remote_tree["sections"].get(s))
+        remote_entries = {}
+        for section in plan["sections"]:
+            if section in remote_tree["sections"]:
+                entries = remote.section_entries(section)
+                plan["remote_sections"][section] = entries
+                remote_entries.update((e["alias"], e) for e in entries)
+        local_by_name = {e["alias"]: e for e in local_entries}
+        names = set(remote_entries)
+        for section in plan["sections"]:
+            names.update(local_sections.get(section, ()))
+        base = self.load_bases().get(remote.path, {})
+        for name in sorted(names):
+            mine, theirs, old = local_by_name.get(name), remote_entries.get(name), base.get(name)
+            if mine == theirs:
+                continue
+            if theirs == old:
+                plan["push"][name] = (mine, theirs)
+            elif mine == old:
+                plan["pull"][name] = (mine, theirs)
+            else:
+                plan["conflicts"][name] = (mine, theirs)
+        return plan
+
+    def apply_remote(self, plan):
+        changed = {section: {e["alias"]: e for e in entries} for section, entries in plan["remote_sections"].items()}
+        for name, (new, old) in plan["push"].items():
+            if old:
+                changed.setdefault(old["section"], {}).pop(name, None)
+            if new:
+                changed.setdefault(new["section"], {})[name] = new
+        if plan["push"]:
+            plan["remote"].write_sections({section: list(entries.values()) for section, entries in changed.items()})
+
+    @staticmethod
+    def resolve(plan, take):
+        target = plan["push"] if take == "local" else plan["pull"]
+        target.update(plan["conflicts"])
+        plan["conflicts"] = {}
+        return plan
+
+    def record_base(self, plan, local_entries):
+        base = {e["alias"]: e for e in local_entries}
+        old_base = self.load_bases().get(plan["remote"].path, {})
+        for name in plan["conflicts"]:
+            if name in old_base:
+                base[name] = old_base[name]
+            else:
+                base.pop(name, None)
+        self.save_base(plan["remote"], base)
+
+    @staticmethod
+    def report(plan):
+        lines = [f"Remote: {plan['remote'].path}"]
+        if not plan["sections"]:
+            lines.append("Already in sync.")
+            return "\n".join(lines)
+        lines.append(f"{len(plan['sections'])} of {plan['total_sections']} sections differ.")
+        lines.append(f"Pull {len(plan['pull'])}, push {len(plan['push'])}, conflicts {len(plan['conflicts'])}.")
+        changes = {}
+        for action, marker in (("pull", "<"), ("push", ">"), ("conflicts", "!")):
+            for name, (mine, theirs) in plan[action].items():
+                entry = (theirs if action == "pull" else mine) or mine or theirs
+                changes.setdefault(entry["section"], []).append((name, marker, mine, theirs))
+        for section in sorted(changes):
+            lines.append("")
+            lines.append(f"[{section}]")
+            for name, marker, mine, theirs in sorted(changes[section]):
+                local_text = mine["command"] if mine else "(none)"
+                remote_text = theirs["command"] if theirs else "(none)"
+                lines.append(f"  {marker} {name}: local {local_text} | remote {remote_text}")
+        lines.append("")
+        lines.append("< apply remote change locally, > send local change to remote, ! changed on both sides (left untouched)")
+        return "\n".join(lines)
+
+class HistoryAnalyzer:
+    TAIL_BYTES = 64
+    COMMAND_WORD_PATTERN = re.compile(rb"(?:^|&&|\|\||[;&|(`{]|\$\()\s*([^\s;&|()<>`'\"=$]+)")
+    TIMESTAMP_PATTERN = re.compile(rb"#(\d{9,11})\r?$")
+
+    def __init__(self, state_path, history_paths=None):
+        self.state_path = state_path
+        self.history_paths = history_paths or [os.path.expanduser("~/.bash_history")]
+        self.state = {"files": {}}
+        self.lock = threading.Lock()
+        self.load_state()
+
+    def load_state(self):
+        if os.path.exists(self.state_path):
+            try:
+                with open(self.state_path, 'r') as f:
+                    self.state = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"Error loading history statistics: {e}")
+                self.state = {"files": {}}
+        self.state.setdefault("files", {})
+
+    def save_state(self):
+        with open(self.state_path, 'w') as f:
+            json.dump(self.state, f, indent=4)
+
+    def analyze(self, alias_names):
+        names = set(alias_names)
+        with self.lock:
+            paths = [self.normalize(path) for path in self.history_paths]
+            for path in set(self.state["files"]) - set(paths):
+                del self.state["files"][path]
+            for path in paths:
+                self.scan_file(path, names)
+            self.save_state()
+            return self.usage(names)
+
+    @staticmethod
+    def normalize(path):
+        return os.path.abspath(os.path.expanduser(path))
+
+    def scan_file(self, path, names):
+        path = self.normalize(path)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return
+        entry = self.state["files"].get(path)
+        if entry is None or entry.get("inode") != stat.st_ino or entry.get("offset", 0) > stat.st_size or not self.same_prefix(path, entry):
+            entry = {"inode": stat.st_ino, "offset": 0, "tracked": [], "counts": {}}
+            self.state["files"][path] = entry
+        counts = entry["counts"]
+        offset = entry["offset"]
+        new_names = names - set(entry["tracked"])
+        for name in list(counts):
+            if name not in names or name in new_names:
+                del counts[name]
+        entry["tracked"] = sorted(names)
+        if stat.st_size == 0:
+            return
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if new_names and offset:
+                self.count_range(mm, 0, offset, new_names, counts)
+            end = mm.rfind(b"\n", offset) + 1
+            if end > offset:
+                fallback_ts = entry.get("timestamp") or (int(stat.st_mtime) if offset else None)
+                self.count_range(mm, offset, end, names, counts, fallback_ts)
+                entry["timestamp"] = self.last_timestamp(mm, offset, end) or entry.get("timestamp")
+                entry["offset"] = end
+                entry["tail"] = hashlib.sha1(mm[max(0, end - self.TAIL_BYTES):end]).hexdigest()[:16]
+
+    @classmethod
+    def same_prefix(cls, path, entry):
+        offset = entry.get("offset", 0)
+        if not offset or not entry.get("tail"):
+            return True
+        try:
+            with open(path, 'rb') as f:
+                f.seek(max(0, offset - cls.TAIL_BYTES))
+                data = f.read(offset - max(0, offset - cls.TAIL_BYTES))
+        except OSError:
+            return False
+        return hashlib.sha1(data).hexdigest()[:16] == entry["tail"]
+
+    @classmethod
+    def last_timestamp(cls, mm, start, end):
+        pos = end
+        while pos > start:
+            hit = mm.rfind(b"\n#", start, pos)
+            line_start = hit + 1 if hit != -1 else start
+            line_end = mm.find(b"\n", line_start, end)
+            match = cls.TIMESTAMP_PATTERN.match(mm[line_start:line_end if line_end != -1 else end])
+            if match:
+                return int(match.group(1))
+            if hit == -1:
+                return None
+            pos = hit
+        return None
+
+    def count_range(self, mm, start, end, names, counts, fallback_ts=None):
+        encoded = {name.encode(): name for name in names}
+        if not encoded:
+            return
+        find_words = self.COMMAND_WORD_PATTERN.findall
+        for line, timestamp in self.iter_lines(mm, start, end, fallback_ts):
+            for word in find_words(line):
+                name = encoded.get(word)
+                if name is None:
+                    continue
+                stats = counts.setdefault(name, [0, None])
+                stats[0] += 1
+                if timestamp and (stats[1] is None or timestamp > stats[1]):
+                    stats[1] = timestamp
+
+    @classmethod
+    def iter_lines(cls, mm, start, end, timestamp=None):
+        match_timestamp = cls.TIMESTAMP_PATTERN.match
+        pos = start
+        while pos < end:
+            newline = mm.find(b"\n", pos, end)
+            if newline == -1:
+                newline = end
+            line = mm[pos:newline]
+            pos = newline + 1
+            if line.startswith(b"#"):
+                match = match_timestamp(line)
+                if match:
+                    timestamp = int(match.group(1))
+                continue
+            yield line, timestamp
+
+    def usage(self, names):
+        result = {}
+        for entry in self.state["files"].values():
+            for name, (count, last_used) in entry["counts"].items():
+                if name not in names:
+                    continue
+                total, last = result.get(name, (0, None))
+                if last_used and (last is None or last_used > last):
+                    last = last_used
+                result[name] = (total + count, last)
+        return result
+
+class ExecutableIndex:
+    def __init__(self, cache_path):
+        self.cache_path = cache_path
+        self.cache = {}
+        self.index = {}
+        self.lock = threading.Lock()
+        self.load_cache()
+
+    def load_cache(self):
+        if os.path.exists(self.cache_path):
+            try:
+                with open(self.cache_path, 'r') as f:
+                    self.cache = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"Error loading executable index: {e}")
+                self.cache = {}
+
+    def save_cache(self):
+        try:
+            AliasSync.write_json(self.cache_path, self.cache)
+        except OSError as e:
+            print(f"Error saving executable index: {e}")
+
+    def refresh(self, path_env=None):
+        with self.lock:
+            return self.refresh_index(path_env)
+
+    def refresh_index(self, path_env):
+        if path_env is None:
+            path_env = os.environ.get("PATH", "")
+        index = {}
+        changed = False
+        for directory in path_env.split(os.pathsep):
+            if not directory:
+                continue
+            try:
+                mtime = os.stat(directory).st_mtime
+            except OSError:
+                continue
+            entry = self.cache.get(directory)
+            if entry is None or entry["mtime"] != mtime:
+                entry = {"mtime": mtime, "names": self.list_executables(directory)}
+                self.cache[directory] = entry
+                changed = True
+            for name in entry["names"]:
+                index.setdefault(name, os.path.join(directory, name))
+        if changed:
+            self.save_cache()
+        self.index = index
+        return index
+
+    def list_executables(self, directory):
+        names = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file() and os.access(entry.path, os.X_OK):
+                            names.append(entry.name)
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        return names
+
+class ConflictDetector:
+    BASH_BUILTINS = (
+        ".", ":", "[", "alias", "bg", "bind", "break", "builtin", "caller", "cd", "command", "compgen",
+        "complete", "compopt", "continue", "declare", "dirs", "disown", "echo", "enable", "eval", "exec",
+        "exit", "export", "false", "fc", "fg", "getopts", "hash", "help", "history", "jobs", "kill", "let",
+        "local", "logout", "mapfile", "popd", "printf", "pushd", "pwd", "read", "readarray", "readonly",
+        "return", "set", "shift", "shopt", "source", "suspend", "test", "times", "trap", "true", "type",
+        "typeset", "ulimit", "umask", "unalias", "unset", "wait"
+    )
+    BASH_KEYWORDS = (
+        "!", "[[", "]]", "{", "}", "case", "coproc", "do", "done", "elif", "else", "esac", "fi", "for",
+        "function", "if", "in", "select", "then", "time", "until", "while"
+    )
+
+    def __init__(self, executable_index):
+        self.executable_index = executable_index
+
+    def executables(self):
+        return self.executable_index.refresh()
+
+    def check(self, alias_name, aliases, functions, other_definitions):
+        count = sum(1 for a in aliases if a.alias == alias_name) + 1
+        return self.warnings(alias_name, self.executables(), functions, other_definitions, count)
+
+    def scan(self, aliases, functions, other_definitions):
+        executables = self.executables()
+        counts = {}
+        for a in aliases:
+            counts[a.alias] = counts.get(a.alias, 0) + 1
+        conflicts = {}
+        for name, count in counts.items():
+            warnings = self.warnings(name, executables, functions, other_definitions, count)
+            if warnings:
+                conflicts[name] = warnings
+        return conflicts
+
+    def warnings(self, name, executables, functions, other_definitions, count):
+        warnings = []
+        if name in self.BASH_BUILTINS:
+            warnings.append(f"shadows bash builtin '{name}'")
+        elif name in self.BASH_KEYWORDS:
+            warnings.append(f"shadows shell keyword '{name}'")
+        if name in executables:
+            warnings.append(f"shadows executable {executables[name]}")
+        if name in functions:
+            warnings.append(f"shadows function defined in {functions[name]}")
+        if name in other_definitions:
+            warnings.append(f"also defined in {', '.join(other_definitions[name])}")
+        if count > 1:
+            warnings.append(f"defined {count} times")
+        return warnings
+
+class CommandParser:
+    SEPARATORS = ";&|()`\n"
+    COMMAND_PREFIX_KEYWORDS = ("!", "{", "}", "do", "done", "elif", "else", "fi", "if", "then", "time", "until", "while", "esac")
+    NON_COMMAND_KEYWORDS = ("case", "for", "function", "select", "in")
+    ASSIGNMENT_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*(?:\[[^]]*\])?\+?=")
+    REDIRECTION_PATTERN = re.compile(r"^\d*[<>]")
+    REDIRECTION_OPERATOR_PATTERN = re.compile(r"^\d*(?:[<>]+&?|&>>?)$")
+
+    @classmethod
+    def command_words(cls, command):
+        words = []
+        expect_command = True
+        redirect_target = False
+        i = 0
+        n = len(command)
+        while i < n:
+            ch = command[i]
+            if ch.isspace() and ch != "\n":
+                i += 1
+                continue
+            if ch == "&" and command.startswith("&>", i):
+                j = cls.word_end(command, i + 1)
+                redirect_target = cls.REDIRECTION_OPERATOR_PATTERN.match(command[i:j]) is not None
+                i = j
+                continue
+            if ch in cls.SEPARATORS:
+                expect_command = True
+                i += 1
+                continue
+            if ch == "#":
+                newline = command.find("\n", i)
+                i = n if newline == -1 else newline
+                continue
+            if command.startswith("$(", i):
+                expect_command = True
+                i += 2
+                continue
+            j = cls.word_end(command, i)
+            word = command[i:j]
+            if redirect_target:
+                redirect_target = False
+            elif cls.REDIRECTION_PATTERN.match(word):
+                redirect_target = cls.REDIRECTION_OPERATOR_PATTERN.match(word) is not None
+            elif expect_command and not cls.ASSIGNMENT_PATTERN.match(word):
+                if word in cls.NON_COMMAND_KEYWORDS:
+                    expect_command = False
+                elif word not in cls.COMMAND_PREFIX_KEYWORDS:
+                    words.append((i, j, word))
+                    expect_command = False
+            i = max(j, i + 1)
+        return words
+
+    @classmethod
+    def word_end(cls, command, i):
+        n = len(command)
+        while i < n:
+            ch = command[i]
+            if ch.isspace():
+                break
+            if ch == "\\":
+                i += 2
+                continue
+            if ch == "'":
+                end = command.find("'", i + 1)
+                i = n if end == -1 else end + 1
+                continue
+            if ch == '"':
+                i += 1
+                while i < n and command[i] != '"':
+                    i += 2 if command[i] == "\\" else 1
+                i += 1
+                continue
+            if command.startswith("$(", i):
+                break
+            if ch == "&" and i > 0 and command[i - 1] in "<>":
+                i += 1
+                continue
+            if ch in cls.SEPARATORS:
+                break
+            i += 1
+        return min(i, n)
+
+    @staticmethod
+    def is_quoted(word):
+        return any(ch in word for ch in "'\"\\")
+
+    @staticmethod
+    def unquote(word):
+        try:
+            parts = shlex.split(word)
+        except ValueError:
+            return word
+        return parts[0] if len(parts) == 1 else word
+
+class DependencyGraph:
+    def __init__(self):
+        self.uses = {}
+        self.used_by = {}
+
+    def rebuild(self, aliases):
+        self.uses = {}
+        self.used_by = {}
+        for a in aliases:
+            self.update(a.alias, a.command)
+
+    @staticmethod
+    def references(command):
+        return {word for _, _, word in CommandParser.command_words(command) if not CommandParser.is_quoted(word)}
+
+    def update(self, alias_name, command):
+        self.remove(alias_name)
+        words = self.references(command)
+        words.discard(alias_name)
+        self.uses[alias_name] = words
+        for word in words:
+            self.used_by.setdefault(word, set()).add(alias_name)
+
+    def remove(self, alias_name):
+        for word in self.uses.pop(alias_name, ()):
+            dependents = self.used_by.get(word)
+            if dependents:
+                dependents.discard(alias_name)
+                if not dependents:
+                    del self.used_by[word]
+
+    def dependents(self, alias_name):
+        return sorted(self.used_by.get(alias_name, ()))
+
+    def dependencies(self, alias_name):
+        return sorted(word for word in self.uses.get(alias_name, ()) if word in self.uses)
+
+    def find_cycles(self):
+        index = {}
+        lowlink = {}
+        on_stack = set()
+        stack = []
+        cycles = []
+        counter = 0
+        for root in self.uses:
+            if root in index:
+                continue
+            work = [(root, iter(self.dependencies(root)))]
+            index[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                node, children = work[-1]
+                child = next(children, None)
+                if child is not None:
+                    if child not in index:
+                        index[child] = lowlink[child] = counter
+                        counter += 1
+                        stack.append(child)
+                        on_stack.add(child)
+                        work.append((child, iter(self.dependencies(child))))
+                    elif child in on_stack:
+                        lowlink[node] = min(lowlink[node], index[child])
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    if len(component) > 1:
+                        cycles.append(sorted(component))
+        return cycles
+
+    def cycle_warnings(self):
+        warnings = {}
+        for cycle in self.find_cycles():
+            for name in cycle:
+                warnings[name] = [f"part of alias cycle: {', '.join(cycle)}"]
+        return warnings
+
+    @staticmethod
+    def rewrite_references(command, alias_name, replacement):
+        for start, end, word in reversed(CommandParser.command_words(command)):
+            if word == alias_name:
+                command = command[:start] + replacement + command[end:]
+        return command
+
+class CommandValidator:
+    ALIAS_NAME_PATTERN = re.compile(r"^[^\s=/$`'\"\\|&;()<>]+$")
+
+    def __init__(self, cache_path, max_workers=None):
+        self.cache_path = cache_path
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
+        self.bash_path = shutil.which("bash")
+        self.cache = {}
+        self.lock = threading.Lock()
+        self.load_cache()
+
+    def load_cache(self):
+        if os.path.exists(self.cache_path):
+            try:
+                with open(self.cache_path, 'r') as f:
+                    self.cache = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"Error loading validation cache: {e}")
+                self.cache = {}
+
+    def save_cache(self):
+        try:
+            with open(self.cache_path, 'w') as f:
+                json.dump(self.cache, f)
+        except OSError as e:
+            print(f"Error saving validation cache: {e}")
+
+    @staticmethod
+    def command_hash(command):
+        return hashlib.sha256(command.encode("utf-8")).hexdigest()
+
+    def validate(self, aliases, known_commands):
+        syntax = {}
+        pending = {}
+        with self.lock:
+            for a in aliases:
+                key = self.command_hash(a.command)
+                if key in self.cache:
+                    syntax[key] = self.cache[key]
+                else:
+                    pending[key] = a.command
+        if pending:
+            if len(pending) == 1:
+                checked = {key: self.check_syntax(command) for key, command in pending.items()}
+            else:
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    checked = dict(zip(pending, executor.map(self.check_syntax, pending.values())))
+            syntax.update(checked)
+            with self.lock:
+                self.cache.update(checked)
+                self.save_cache()
+        results = {}
+        for a in aliases:
+            errors = self.check_name(a.alias) + syntax[self.command_hash(a.command)] + self.check_references(a.command, known_commands)
+            if errors:
+                results[a.alias] = errors
+        return results
+
+    def check_name(self, alias_name):
+        if not self.ALIAS_NAME_PATTERN.match(alias_name):
+            return [f"invalid alias name '{alias_name}'"]
+        return []
+
+    def check_syntax(self, command):
+        errors = []
+        rendered = AliasManager.quote_command(command)
+        if AliasManager.parse_command_value(rendered) != command:
+            errors.append("quoting does not round-trip")
+        if self.bash_path:
+            try:
+                result = subprocess.run([self.bash_path, "-n"], input=f"alias _validate_={rendered}\n{command}\n", capture_output=True, text=True, timeout=10)
+            except (OSError, subprocess.TimeoutExpired) as e:
+                errors.append(f"syntax check failed: {e}")
+            else:
+                for line in result.stderr.splitlines():
+                    line = re.sub(r"^.*?: line \d+: ", "", line.strip())
+                    if line and line not in errors:
+                        errors.append(line)
+        return errors
+
+    def check_references(self, command, known_commands):
+        errors = []
+        for _, _, word in CommandParser.command_words(command):
+            name = CommandParser.unquote(word)
+            if "$" in name or not name:
+                continue
+            if "/" in name:
+                if not os.path.exists(os.path.expanduser(name)):
+                    errors.append(f"'{name}' does not exist")
+            elif name not in known_commands and name not in ConflictDetector.BASH_BUILTINS and name not in ConflictDetector.BASH_KEYWORDS:
+                errors.append(f"command '{name}' not found")
+        return errors
+
+class SpaceSavingCounter:
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.counts = {}
+        self.errors = {}
+        self.heap = []
+
+    def add(self, key, weight=1):
+        counts = self.counts
+        if key in counts:
+            counts[key] += weight
+            return
+        if len(counts) < self.capacity:
+            counts[key] = weight
+            self.errors[key] = 0
+            heapq.heappush(self.heap, (weight, key))
+            return
+        while True:
+            count, victim = heapq.heappop(self.heap)
+            current = counts[victim]
+            if current == count:
+                break
+            heapq.heappush(self.heap, (current, victim))
+        del counts[victim]
+        del self.errors[victim]
+        counts[key] = count + weight
+        self.errors[key] = count
+        heapq.heappush(self.heap, (count + weight, key))
+
+    def items(self):
+        return [(key, count, self.errors[key]) for key, count in self.counts.items()]
+
+class AliasSuggester:
+    DEFAULT_SECTION = "Suggested"
+    CHUNK_BYTES = 1 << 24
+    OPTION_WITH_ARGUMENT_PATTERN = re.compile(rb"-[A-Za-z]|--[A-Za-z][\w-]*")
+
+    def __init__(self, aliases, reserved_names=None, capacity=5000, max_words=6, min_length=10, min_count=3, batch_lines=100000):
+        self.alias_names = {a.alias for a in aliases}
+        self.encoded_alias_names = {name.encode() for name in self.alias_names}
+        self.boolean_options = set()
+        self.reserved_names = set(reserved_names or ())
+        self.alias_commands = {" ".join(a.command.split()) for a in aliases}
+        self.sections_by_word = {}
+        for a in aliases:
+            words = a.command.split()
+            if words:
+                self.sections_by_word.setdefault(words[0], {}).setdefault(a.section, 0)
+                self.sections_by_word[words[0]][a.section] += 1
+        self.capacity = capacity
+        self.max_words = max_words
+        self.min_length = min_length
+        self.min_count = min_count
+        self.batch_lines = batch_lines
+
+    def count_prefixes(self, history_paths):
+        counter = SpaceSavingCounter(self.capacity)
+        self.boolean_options = set()
+        batch = {}
+        pending = 0
+        for path in history_paths:
+            path = os.path.expanduser(path)
+            try:
+                if os.path.getsize(path) == 0:
+                    continue
+                with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    for lines in self.iter_chunks(mm):
+                        for line, count in Counter(lines).items():
+                            self.add_prefixes(line, count, batch)
+                            pending += 1
+                            if pending >= self.batch_lines:
+                                self.flush_batch(counter, batch)
+                                pending = 0
+            except OSError:
+                continue
+        self.flush_batch(counter, batch)
+        return counter
+
+    @classmethod
+    def iter_chunks(cls, mm):
+        start = 0
+        size = len(mm)
+        while start < size:
+            end = min(size, start + cls.CHUNK_BYTES)
+            if end < size:
+                newline = mm.find(b"\n", end)
+                end = size if newline == -1 else newline + 1
+            yield [line for line in mm[start:end].split(b"\n") if line and not line.startswith(b"#")]
+            start = end
+
+    def add_prefixes(self, line, count, batch):
+        words = line.split()
+        if len(words) < 2 or words[0] in self.encoded_alias_names:
+            return
+        first = words[0]
+        normalized = b" ".join(words)
+        max_words = self.max_words
+        min_length = self.min_length
+        get = batch.get
+        last = len(words) - 1
+        end = len(first)
+        units = 1
+        for index in range(1, len(words)):
+            word = words[index]
+            if word[:1] == b"-":
+                if index == last or words[index + 1][:1] == b"-":
+                    self.boolean_options.add((first, word))
+            else:
+                units += 1
+                if units > max_words:
+                    if len(normalized) >= min_length:
+                        batch[normalized] = get(normalized, 0) + count
+                    return
+            end += len(word) + 1
+            if end >= min_length:
+                prefix = normalized[:end]
+                batch[prefix] = get(prefix, 0) + count
+
+    def takes_argument(self, command):
+        words = command.encode().split()
+        return self.OPTION_WITH_ARGUMENT_PATTERN.fullmatch(words[-1]) is not None and (words[0], words[-1]) not in self.boolean_options
+
+    def flush_batch(self, counter, batch):
+        for prefix, count in sorted(batch.items(), key=lambda item: -item[1]):
+            counter.add(prefix.decode("utf-8", "replace"), count)
+        batch.clear()
+
+    def suggest(self, history_paths, limit=20):
+        counter = self.count_prefixes(history_paths)
+        candidates = []
+        for command, count, error in counter.items():
+            guaranteed = count - error
+            if guaranteed < self.min_count or command in self.alias_commands or self.takes_argument(command):
+                continue
+            candidates.append((guaranteed * len(command), guaranteed, command))
+        candidates.sort(key=lambda c: (-c[0], -len(c[2])))
+        chosen = []
+        for score, count, command in candidates:
+            if any(c.startswith(command + " ") or command.startswith(c + " ") for _, c in chosen):
+                continue
+            chosen.append((count, command))
+            if len(chosen) >= limit:
+                break
+        taken = set(self.alias_names)
+        suggestions = []
+        for count, command in chosen:
+            name = self.generate_name(command, taken)
+            taken.add(name)
+            suggestions.append((AliasData(name, command, self.guess_section(command), ""), count))
+        return suggestions
+
+    def generate_name(self, command, taken):
+        initials = "".join(next((ch for ch in word if ch.isalnum()), "") for word in command.split())
+        base = initials.lower() or "a"
+        name = base
+        suffix = 2
+        while name in taken or name in self.reserved_names:
+            name = f"{base}{suffix}"
+            suffix += 1
+        return name
+
+    def guess_section(self, command):
+        sections = self.sections_by_word.get(command.split()[0])
+        if not sections:
+            return self.DEFAULT_SECTION
+        return max(sections, key=sections.get)
+
 class UndoRedoManager:
     def __init__(self, max_history=30):
         self.history = []
@@ -299,6 +1934,9 @@ class StatusBar(ttk.Frame):
         self.message_var = tk.StringVar()
         self.message_label = ttk.Label(self, textvariable=self.message_var, anchor=tk.W, padding=(5, 2))
         self.message_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.lock_var = tk.StringVar()
+        self.lock_label = ttk.Label(self, textvariable=self.lock_var, anchor=tk.E, padding=(5, 2))
+        self.lock_label.pack(side=tk.RIGHT)
 
     def set_message(self, message, message_type="info"):
         self.message_var.set(message)
@@ -317,11 +1955,19 @@ class StatusBar(ttk.Frame):
     def clear_message(self):
         self.message_var.set("")
 
+    def set_lock_wait(self, seconds, timed_out=False):
+        if timed_out:
+            self.lock_var.set(f"File lock: timed out after {seconds:.1f}s")
+            self.lock_label.configure(foreground="red")
+        else:
+            self.lock_var.set(f"File lock: {seconds * 1000:.0f} ms")
+            self.lock_label.configure(foreground="orange" if seconds >= 0.5 else "gray")
+
 class AliasDetailDialog(tk.Toplevel):
-    def __init__(self, parent, alias):
+    def __init__(self, parent, alias, uses=None, used_by=None):
         super().__init__(parent)
         self.title(f"Alias Details: {alias.alias}")
-        self.geometry("600x400")
+        self.geometry("600x450")
         self.minsize(500, 350)
         self.transient(parent)
         frame = ttk.Frame(self, padding=20)
@@ -342,9 +1988,13 @@ class AliasDetailDialog(tk.Toplevel):
         command_text.configure(state="disabled")
         ttk.Label(frame, text="Section:", style="Heading.TLabel").grid(row=2, column=0, sticky=tk.W, pady=5)
         ttk.Label(frame, text=alias.section).grid(row=2, column=1, sticky=tk.W, pady=5)
-        ttk.Label(frame, text="Description:", style="Heading.TLabel").grid(row=3, column=0, sticky=tk.NW, pady=5)
+        ttk.Label(frame, text="Uses:", style="Heading.TLabel").grid(row=3, column=0, sticky=tk.NW, pady=5)
+        ttk.Label(frame, text=", ".join(uses or []) or "—", wraplength=400).grid(row=3, column=1, sticky=tk.W, pady=5)
+        ttk.Label(frame, text="Used by:", style="Heading.TLabel").grid(row=4, column=0, sticky=tk.NW, pady=5)
+        ttk.Label(frame, text=", ".join(used_by or []) or "—", wraplength=400).grid(row=4, column=1, sticky=tk.W, pady=5)
+        ttk.Label(frame, text="Description:", style="Heading.TLabel").grid(row=5, column=0, sticky=tk.NW, pady=5)
         desc_frame = ttk.Frame(frame)
-        desc_frame.grid(row=3, column=1, sticky=tk.NSEW, pady=5)
+        desc_frame.grid(row=5, column=1, sticky=tk.NSEW, pady=5)
         desc_text = tk.Text(desc_frame, height=10, width=50, wrap=tk.WORD)
         desc_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         desc_scroll = ttk.Scrollbar(desc_frame, orient=tk.VERTICAL, command=desc_text.yview)
@@ -352,9 +2002,9 @@ class AliasDetailDialog(tk.Toplevel):
         desc_text.configure(yscrollcommand=desc_scroll.set)
         desc_text.insert("1.0", alias.description)
         desc_text.configure(state="disabled")
-        ttk.Button(frame, text="Close", command=self.destroy).grid(row=4, column=0, columnspan=2, pady=20)
+        ttk.Button(frame, text="Close", command=self.destroy).grid(row=6, column=0, columnspan=2, pady=20)
         frame.columnconfigure(1, weight=1)
-        frame.rowconfigure(3, weight=1)
+        frame.rowconfigure(5, weight=1)
         self.center_on_parent()
         self.update_idletasks()
         self.after(100, self.safely_set_grab)
@@ -379,8 +2029,73 @@ class AliasDetailDialog(tk.Toplevel):
         y = parent_y + (parent_height - height) // 2
         self.geometry(f"{width}x{height}+{x}+{y}")
 
+class TextReportDialog(tk.Toplevel):
+    def __init__(self, parent, title, text):
+        super().__init__(parent)
+        self.title(title)
+        self.geometry("700x450")
+        self.minsize(400, 250)
+        self.transient(parent)
+        frame = ttk.Frame(self, padding=10)
+        frame.pack(fill=tk.BOTH, expand=True)
+        text_frame = ttk.Frame(frame)
+        text_frame.pack(fill=tk.BOTH, expand=True)
+        report_text = tk.Text(text_frame, wrap=tk.NONE, font=("Consolas", 10))
+        report_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        report_scroll = ttk.Scrollbar(text_frame, orient=tk.VERTICAL, command=report_text.yview)
+        report_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+        report_text.configure(yscrollcommand=report_scroll.set)
+        report_text.insert("1.0", text)
+        report_text.configure(state="disabled")
+        ttk.Button(frame, text="Close", command=self.destroy).pack(pady=(10, 0))
+        self.focus_set()
+
+class AliasSuggestionDialog(tk.Toplevel):
+    def __init__(self, parent, suggestions, on_add):
+        super().__init__(parent)
+        self.title("Suggested Aliases")
+        self.geometry("700x400")
+        self.minsize(500, 300)
+        self.transient(parent)
+        self.on_add = on_add
+        self.suggestions = {}
+        frame = ttk.Frame(self, padding=10)
+        frame.pack(fill=tk.BOTH, expand=True)
+        ttk.Label(frame, text="Frequent commands without an alias. Select the ones to add:").pack(fill=tk.X, pady=(0, 10))
+        tree_frame = ttk.Frame(frame)
+        tree_frame.pack(fill=tk.BOTH, expand=True)
+        self.tree = ttk.Treeview(tree_frame, columns=("alias", "command", "section", "uses"), show="headings", selectmode="extended")
+        self.tree.heading("alias", text="Alias")
+        self.tree.heading("command", text="Command")
+        self.tree.heading("section", text="Section")
+        self.tree.heading("uses", text="Uses")
+        self.tree.column("alias", width=80)
+        self.tree.column("command", width=350)
+        self.tree.column("section", width=120)
+        self.tree.column("uses", width=60, anchor=tk.E)
+        scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        for alias, count in suggestions:
+            item = self.tree.insert("", tk.END, values=(alias.alias, alias.command, alias.section, count))
+            self.suggestions[item] = alias
+        buttons = ttk.Frame(frame)
+        buttons.pack(fill=tk.X, pady=(10, 0))
+        ttk.Button(buttons, text="Add selected", command=self.add_selected, style="Primary.TButton").pack(side=tk.LEFT, padx=5)
+        ttk.Button(buttons, text="Close", command=self.destroy).pack(side=tk.RIGHT, padx=5)
+        self.focus_set()
+
+    def add_selected(self):
+        selected = self.tree.selection()
+        if not selected:
+            messagebox.showerror("Error", "No suggestion selected", parent=self)
+            return
+        if self.on_add([self.suggestions[item] for item in selected]):
+            self.tree.delete(*selected)
+
 class AliasManagerApp:
-    def __init__(self, root):
+    def __init__(self, root, alias_manager=None):
         self.root = root
         self.root.title("Alias Manager")
         self.default_settings = {
@@ -390,14 +2105,35 @@ class AliasManagerApp:
                 'alias': 100,
                 'command': 300,
                 'section': 150,
-                'description': 200
+                'description': 200,
+                'tags': 120,
+                'uses': 60,
+                'last_used': 120,
+                'warnings': 200,
+                'origin': 150,
+                '#0': 180
             },
             'sort_by': 'alias',
             'sort_ascending': True,
-            'theme': 'default'
+            'theme': 'default',
+            'history_files': [],
+            'grouped_view': True
         }
-        self.alias_manager = AliasManager()
+        self.column_titles = {
+            'alias': "Alias",
+            'command': "Command",
+            'section': "Section",
+            'description': "Description",
+            'tags': "Tags",
+            'uses': "Uses",
+            'last_used': "Last used",
+            'warnings': "Warnings",
+            'origin': "Origin"
+        }
+        self.alias_manager = alias_manager or AliasManager()
         self.undo_redo = UndoRedoManager()
+        self.background_tasks = {}
+        self.background_pending = {}
         self.load_settings()
         self.root.geometry(self.settings['window_geometry'])
         self.create_styles()
@@ -406,6 +2142,8 @@ class AliasManagerApp:
         self.update_section_dropdown()
         self.bind_events()
         self.add_keyboard_shortcuts()
+        self.start_history_analysis()
+        self.start_validation()
 
     def create_styles(self):
         style = ttk.Style()
@@ -429,6 +2167,7 @@ class AliasManagerApp:
         separator.pack(side=tk.BOTTOM, fill=tk.X)
         self.status_bar = StatusBar(self.root)
         self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
+        self.alias_manager.on_lock_wait = self.status_bar.set_lock_wait
 
     def create_menu(self):
         menu_bar = tk.Menu(self.root)
@@ -438,6 +2177,9 @@ class AliasManagerApp:
         file_menu.add_separator()
         file_menu.add_command(label="Import aliases", command=self.import_aliases)
         file_menu.add_command(label="Export aliases", command=self.export_aliases)
+        file_menu.add_command(label="Export selected aliases", command=self.export_selected)
+        file_menu.add_command(label="Sync with export file", command=self.sync_with_file)
+        file_menu.add_command(label="Sync with directory", command=self.sync_with_directory)
         file_menu.add_separator()
         file_menu.add_command(label="Backup .bashrc", command=self.backup_bashrc)
         file_menu.add_separator()
@@ -450,12 +2192,26 @@ class AliasManagerApp:
         edit_menu.add_command(label="Redo", command=self.redo_action, accelerator="Ctrl+Y")
         edit_menu.add_separator()
         edit_menu.add_command(label="Delete alias", command=self.delete_alias, accelerator="Delete")
+        edit_menu.add_separator()
+        edit_menu.add_command(label="Select all", command=self.select_all_aliases, accelerator="Ctrl+A")
+        edit_menu.add_command(label="Move selected to section", command=self.move_selected)
+        edit_menu.add_command(label="Tag selected", command=self.tag_selected)
+        edit_menu.add_command(label="Find and replace in selected", command=self.replace_in_selected)
         menu_bar.add_cascade(label="Edit", menu=edit_menu)
         section_menu = tk.Menu(menu_bar, tearoff=0)
         section_menu.add_command(label="Add section", command=self.add_section)
         section_menu.add_command(label="Rename section", command=self.rename_section)
         section_menu.add_command(label="Delete section", command=self.delete_section)
         menu_bar.add_cascade(label="Sections", menu=section_menu)
+        tools_menu = tk.Menu(menu_bar, tearoff=0)
+        tools_menu.add_command(label="Analyze history", command=self.start_history_analysis)
+        tools_menu.add_command(label="Add history file", command=self.add_history_file)
+        tools_menu.add_separator()
+        tools_menu.add_command(label="Suggest aliases", command=self.suggest_aliases)
+        tools_menu.add_separator()
+        tools_menu.add_command(label="Conflict report", command=self.show_conflict_report)
+        tools_menu.add_command(label="Validate all", command=self.validate_all)
+        menu_bar.add_cascade(label="Tools", menu=tools_menu)
         help_menu = tk.Menu(menu_bar, tearoff=0)
         help_menu.add_command(label="About", command=self.show_about)
         help_menu.add_command(label="Keyboard Shortcuts", command=self.show_shortcuts)
@@ -481,20 +2237,34 @@ class AliasManagerApp:
         self.section_filter_var = tk.StringVar(value="All")
         self.section_filter = ttk.Combobox(section_filter_frame, textvariable=self.section_filter_var)
         self.section_filter.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.grouped_view_var = tk.BooleanVar(value=self.settings['grouped_view'])
+        ttk.Checkbutton(search_frame, text="Group by section", variable=self.grouped_view_var, command=self.toggle_grouped_view).pack(anchor=tk.W, pady=(0, 5))
         tree_frame = ttk.Frame(left_panel)
         tree_frame.pack(fill=tk.BOTH, expand=True)
-        columns = ("alias", "command", "section", "description")
-        self.alias_tree = ttk.Treeview(tree_frame, columns=columns, show="headings")
+        columns = tuple(self.column_titles)
+        self.alias_tree = ttk.Treeview(tree_frame, columns=columns, show="tree headings" if self.settings['grouped_view'] else "headings", selectmode="extended")
+        self.grouped_rows = {}
+        self.section_cache = {}
+        self.alias_items = {}
+        self.item_aliases = {}
+        self.last_filter = None
+        self.alias_tree.heading("#0", text="Section")
+        self.alias_tree.column("#0", width=self.settings['column_widths']['#0'], stretch=False)
         self.sort_by = self.settings['sort_by']
         self.sort_ascending = self.settings['sort_ascending']
-        self.alias_tree.heading("alias", text="Alias", command=lambda: self.sort_treeview("alias"))
-        self.alias_tree.heading("command", text="Command", command=lambda: self.sort_treeview("command"))
-        self.alias_tree.heading("section", text="Section", command=lambda: self.sort_treeview("section"))
-        self.alias_tree.heading("description", text="Description", command=lambda: self.sort_treeview("description"))
+        for col in columns:
+            self.alias_tree.heading(col, text=self.column_titles[col], command=lambda c=col: self.sort_treeview(c))
         self.alias_tree.column("alias", width=self.settings['column_widths']['alias'], stretch=True)
         self.alias_tree.column("command", width=self.settings['column_widths']['command'], stretch=True)
         self.alias_tree.column("section", width=self.settings['column_widths']['section'], stretch=True)
         self.alias_tree.column("description", width=200, stretch=True)
+        self.alias_tree.column("tags", width=self.settings['column_widths']['tags'], stretch=True)
+        self.alias_tree.column("uses", width=self.settings['column_widths']['uses'], stretch=False, anchor=tk.E)
+        self.alias_tree.column("last_used", width=self.settings['column_widths']['last_used'], stretch=False)
+        self.alias_tree.column("warnings", width=self.settings['column_widths']['warnings'], stretch=True)
+        self.alias_tree.column("origin", width=self.settings['column_widths']['origin'], stretch=True)
+        self.alias_tree.tag_configure("conflict", foreground="#b35900")
+        self.alias_tree.tag_configure("read_only", foreground="gray")
         tree_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.alias_tree.yview)
         self.alias_tree.configure(yscrollcommand=tree_scrollbar.set)
         self.alias_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -558,6 +2328,8 @@ class AliasManagerApp:
         self.root.bind("<Configure>", self.on_window_configure)
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
         self.alias_tree.bind("<<TreeviewSelect>>", self.on_alias_select)
+        self.alias_tree.bind("<<TreeviewOpen>>", self.on_section_open)
+        self.alias_tree.bind("<Control-a>", lambda e: self.select_all_aliases() or "break")
         self.alias_tree.bind("<Double-1>", self.on_alias_double_click)
         self.alias_tree.bind("<ButtonRelease-1>", self.on_column_resize)
         self.section_filter.bind("<<ComboboxSelected>>", lambda e: self.filter_aliases())
@@ -580,6 +2352,10 @@ class AliasManagerApp:
         except Exception as e:
             print(f"Error loading settings: {e}")
             self.settings = self.default_settings.copy()
+        for key, value in self.default_settings.items():
+            self.settings.setdefault(key, value)
+        for col, width in self.default_settings['column_widths'].items():
+            self.settings['column_widths'].setdefault(col, width)
 
     def save_settings(self):
         try:
@@ -592,20 +2368,120 @@ class AliasManagerApp:
         except Exception as e:
             print(f"Error saving settings: {e}")
 
-    def refresh_aliases(self):
-        self.alias_tree.delete(*self.alias_tree.get_children())
-        filtered_aliases = [a for a in self.alias_manager.aliases if self.matches_filter(a)]
-        self.sort_aliases(filtered_aliases)
-        for alias in filtered_aliases:
-            self.alias_tree.insert("", tk.END, values=(alias.alias, alias.command, alias.section, alias.description))
-        for col in ["alias", "command", "section"]:
+    def refresh_aliases(self, reuse_filter=False):
+        filtered_aliases = self.filtered_aliases(reuse_filter)
+        if self.settings['grouped_view']:
+            self.refresh_sections(filtered_aliases)
+        else:
+            self.sort_aliases(filtered_aliases)
+            self.alias_tree.delete(*self.alias_tree.get_children())
+            for alias in filtered_aliases:
+                values, tags = self.alias_row(alias)
+                self.alias_tree.insert("", tk.END, iid=self.alias_item(alias), values=values, tags=tags)
+        for col, title in self.column_titles.items():
             if col == self.sort_by:
                 direction = "▲" if self.sort_ascending else "▼"
-                self.alias_tree.heading(col, text=f"{col.capitalize()} {direction}")
+                self.alias_tree.heading(col, text=f"{title} {direction}")
             else:
-                self.alias_tree.heading(col, text=col.capitalize())
+                self.alias_tree.heading(col, text=title)
         self.update_undo_redo_buttons()
 
+    def number_alias_items(self):
+        self.alias_items = {}
+        self.item_aliases = {}
+        seen = {}
+        for alias in self.alias_manager.aliases:
+            seen[alias.alias] = seen.get(alias.alias, 0) + 1
+            item = f"alias:{seen[alias.alias]}:{alias.alias}"
+            self.alias_items[id(alias)] = item
+            self.item_aliases[item] = alias
+
+    def alias_item(self, alias):
+        item = self.alias_items.get(id(alias))
+        if item is None or self.item_aliases.get(item) is not alias:
+            self.number_alias_items()
+            item = self.alias_items.get(id(alias))
+        return item
+
+    def alias_row(self, alias):
+        uses, last_used = self.alias_manager.usage.get(alias.alias, (0, None))
+        last_used_text = datetime.fromtimestamp(last_used).strftime("%Y-%m-%d %H:%M") if last_used else ""
+        warnings = self.alias_warnings(alias.alias)
+        tags = ("conflict",) if warnings else ()
+        if alias.read_only:
+            tags += ("read_only",)
+        origin = f"{alias.origin} (read-only)" if alias.read_only else alias.origin
+        alias_tags = ", ".join(self.alias_manager.tags.get(alias.alias, []))
+        return (alias.alias, alias.command, alias.section, alias.description, alias_tags, uses, last_used_text, "; ".join(warnings), origin), tags
+
+    def refresh_sections(self, filtered_aliases):
+        self.grouped_rows = {}
+        for alias in filtered_aliases:
+            self.grouped_rows.setdefault(alias.section, []).append(alias)
+        sections = sorted(self.grouped_rows, key=str.lower, reverse=self.sort_by == "section" and not self.sort_ascending)
+        wanted = {f"section:{section}" for section in sections}
+        for item in self.alias_tree.get_children():
+            if item not in wanted:
+                self.alias_tree.delete(item)
+                self.section_cache.pop(item[len("section:"):], None)
+        for index, section in enumerate(sections):
+            item = f"section:{section}"
+            text = f"{section} ({len(self.grouped_rows[section])})"
+            if self.alias_tree.exists(item):
+                self.alias_tree.item(item, text=text)
+                self.alias_tree.move(item, "", index)
+            else:
+                self.alias_tree.insert("", index, iid=item, text=text, open=False)
+                self.alias_tree.insert(item, tk.END, iid=f"placeholder:{section}")
+            if self.alias_tree.item(item, "open"):
+                self.populate_section(section)
+
+    def populate_section(self, section):
+        aliases = list(self.grouped_rows.get(section, []))
+        self.sort_aliases(aliases)
+        rows = [(self.alias_item(alias),) + self.alias_row(alias) for alias in aliases]
+        if self.section_cache.get(section) == rows and not self.alias_tree.exists(f"placeholder:{section}"):
+            return
+        item = f"section:{section}"
+        self.alias_tree.delete(*self.alias_tree.get_children(item))
+        for row_item, values, tags in rows:
+            if self.alias_tree.exists(row_item):
+                parent = self.alias_tree.parent(row_item)
+                self.alias_tree.delete(row_item)
+                self.section_cache.pop(parent[len("section:"):], None)
+                if not self.alias_tree.get_children(parent):
+                    self.alias_tree.insert(parent, tk.END, iid=f"placeholder:{parent[len('section:'):]}")
+            self.alias_tree.insert(item, tk.END, iid=row_item, values=values, tags=tags)
+        self.section_cache[section] = rows
+
+    def on_section_open(self, event):
+        item = self.alias_tree.focus()
+        if item.startswith("section:"):
+            self.populate_section(item[len("section:"):])
+
+    def toggle_grouped_view(self):
+        self.settings['grouped_view'] = self.grouped_view_var.get()
+        self.alias_tree.delete(*self.alias_tree.get_children())
+        self.section_cache = {}
+        self.alias_tree.configure(show="tree headings" if self.settings['grouped_view'] else "headings")
+        self.refresh_aliases()
+
+    def selected_alias_names(self):
+        return [alias.alias for alias in self.selected_aliases()]
+
+    def selected_aliases(self):
+        return [self.item_aliases[item] for item in self.alias_tree.selection() if item in self.item_aliases]
+
+    def reveal_alias(self, alias_name):
+        alias = next((a for a in self.alias_manager.aliases if a.alias == alias_name), None)
+        item = self.alias_item(alias)
+        if self.settings['grouped_view'] and alias and self.alias_tree.exists(f"section:{alias.section}"):
+            self.alias_tree.item(f"section:{alias.section}", open=True)
+            self.populate_section(alias.section)
+        if item and self.alias_tree.exists(item):
+            self.alias_tree.selection_set(item)
+            self.alias_tree.see(item)
+
     def refresh_all(self):
         self.new_alias()
         self.alias_manager.load_descriptions()
@@ -615,28 +2491,157 @@ class AliasManagerApp:
         self.search_var.set("")
         self.section_filter_var.set("All")
         self.status_bar.set_message("Application refreshed successfully.", "success")
+        self.start_history_analysis()
+        self.start_validation()
+
+    def history_paths(self):
+        return [os.path.expanduser("~/.bash_history")] + list(self.settings['history_files'])
+
+    def add_history_file(self):
+        filepath = filedialog.askopenfilename(title="Add History File", initialdir=os.path.expanduser("~"))
+        if not filepath:
+            return
+        if filepath not in self.history_paths():
+            self.settings['history_files'].append(filepath)
+        self.start_history_analysis()
+
+    def run_in_background(self, name, task, on_success, *args):
+        if name in self.background_tasks:
+            self.background_pending[name] = (task, on_success, args)
+            return False
+        results = queue.Queue()
+        def worker():
+            try:
+                results.put(("success", task(*args)))
+            except Exception as e:
+                results.put(("error", str(e)))
+        self.background_tasks[name] = results
+        threading.Thread(target=worker, daemon=True).start()
+        self.root.after(200, self.poll_background_task, name, on_success)
+        return True
+
+    def poll_background_task(self, name, on_success):
+        try:
+            status, result = self.background_tasks[name].get_nowait()
+        except queue.Empty:
+            self.root.after(200, self.poll_background_task, name, on_success)
+            return
+        del self.background_tasks[name]
+        if status == "error":
+            self.status_bar.set_message(f"{name} failed: {result}", "error")
+        else:
+            on_success(result)
+        if name in self.background_pending:
+            task, pending_on_success, args = self.background_pending.pop(name)
+            self.run_in_background(name, task, pending_on_success, *args)
+
+    def start_history_analysis(self):
+        self.run_in_background("History analysis", self.alias_manager.analyze_history, self.on_history_analyzed, self.history_paths())
+
+    def on_history_analyzed(self, result):
+        self.alias_manager.usage = result
+        self.refresh_aliases()
+        used = sum(1 for count, _ in result.values() if count)
+        self.status_bar.set_message(f"History analyzed: {used} aliases in use.", "info")
+
+    def start_validation(self):
+        self.run_in_background("Validation", self.alias_manager.validate_aliases, self.on_aliases_validated, list(self.alias_manager.aliases))
+
+    def on_aliases_validated(self, result):
+        self.alias_manager.validation = result
+        self.refresh_aliases()
+        if result:
+            self.status_bar.set_message(f"Validation found problems in {len(result)} aliases.", "warning")
+
+    def alias_warnings(self, alias_name):
+        return self.alias_manager.conflicts.get(alias_name, []) + self.alias_manager.cycles.get(alias_name, []) + self.alias_manager.validation.get(alias_name, [])
+
+    def validation_report(self):
+        if not self.alias_manager.validation:
+            return "All aliases passed validation."
+        report = [f"{len(self.alias_manager.validation)} of {len(self.alias_manager.aliases)} aliases failed validation:", ""]
+        for name in sorted(self.alias_manager.validation):
+            report.append(f"{name}:")
+            report.extend(f"    - {error}" for error in self.alias_manager.validation[name])
+        return "\n".join(report)
+
+    def validate_all(self):
+        self.status_bar.set_message("Validating aliases...", "info")
+        def on_validated(result):
+            self.on_aliases_validated(result)
+            TextReportDialog(self.root, "Validation Report", self.validation_report())
+        self.run_in_background("Validation", self.alias_manager.validate_aliases, on_validated, list(self.alias_manager.aliases))
+
+    def suggest_aliases(self):
+        if self.run_in_background("Alias suggestion", self.alias_manager.suggest_aliases, self.on_aliases_suggested, self.history_paths()):
+            self.status_bar.set_message("Scanning history for alias suggestions...", "info")
+
+    def on_aliases_suggested(self, suggestions):
+        existing = {a.alias for a in self.alias_manager.aliases}
+        suggestions = [(a, count) for a, count in suggestions if a.alias not in existing]
+        if not suggestions:
+            messagebox.showinfo("Suggest Aliases", "No alias suggestions found in your shell history.")
+            return
+        AliasSuggestionDialog(self.root, suggestions, self.add_suggested_aliases)
+
+    def add_suggested_aliases(self, aliases):
+        existing = {a.alias for a in self.alias_manager.aliases}
+        taken = [a.alias for a in aliases if a.alias in existing]
+        aliases = [a for a in aliases if a.alias not in existing]
+        if taken:
+            messagebox.showwarning("Suggest Aliases", f"These aliases already exist and were skipped: {', '.join(taken)}")
+        if not aliases:
+            return bool(taken)
+        validation = self.alias_manager.validate_aliases(aliases)
+        warnings = []
+        for alias in aliases:
+            problems = self.alias_manager.check_alias_conflicts(alias.alias) + validation.get(alias.alias, [])
+            warnings.extend(f"- {alias.alias}: {problem}" for problem in problems)
+        if warnings and not messagebox.askyesno("Alias Warnings", "The suggested aliases have problems:\n\n" + "\n".join(warnings) + "\n\nAdd anyway?"):
+            return False
+        self.save_state()
+        if not self.alias_manager.apply_alias_changes({a.alias: AliasSync.entry(a) for a in aliases}):
+            messagebox.showerror("Error", "Failed to add the suggested aliases")
+            return False
+        self.refresh_aliases()
+        self.update_section_dropdown()
+        self.status_bar.set_message(f"{len(aliases)} suggested aliases added.", "success")
+        self.start_validation()
+        return True
 
     def update_section_dropdown(self):
-        sections_filter = ["All"] + sorted(self.alias_manager.sections)
+        sections_filter = ["All"] + sorted(set(self.alias_manager.sections) | {a.section for a in self.alias_manager.aliases})
         self.section_filter["values"] = sections_filter
         self.section_dropdown["values"] = sorted(self.alias_manager.sections)
         if self.section_var.get() not in self.alias_manager.sections and self.alias_manager.sections:
             self.section_var.set(self.alias_manager.sections[0])
 
-    def matches_filter(self, alias):
+    def filtered_aliases(self, reuse_filter=False):
         section_filter = self.section_filter_var.get()
+        search_text = self.search_var.get().lower()
+        source = self.alias_manager.aliases
+        if reuse_filter and self.last_filter and self.last_filter[0] == section_filter and search_text.startswith(self.last_filter[1]):
+            source = self.last_filter[2]
+        if section_filter == "All" and not search_text:
+            result = list(source)
+        else:
+            result = [a for a in source if self.matches_filter(a, section_filter, search_text)]
+        self.last_filter = (section_filter, search_text, result)
+        return list(result)
+
+    def matches_filter(self, alias, section_filter, search_text):
         if section_filter != "All" and alias.section != section_filter:
             return False
-        search_text = self.search_var.get().lower()
         if search_text:
             if (search_text not in alias.alias.lower() and 
                 search_text not in alias.command.lower() and 
-                search_text not in alias.description.lower()):
+                search_text not in alias.description.lower() and
+                not any(search_text in tag.lower() for tag in self.alias_manager.tags.get(alias.alias, []))):
                 return False
         return True
 
     def filter_aliases(self):
-        self.refresh_aliases()
+        self.refresh_aliases(reuse_filter=True)
 
     def sort_aliases(self, aliases_list):
         if self.sort_by == "alias":
@@ -645,6 +2650,16 @@ class AliasManagerApp:
             key_func = lambda a: a.command.lower()
         elif self.sort_by == "description":
             key_func = lambda a: a.description.lower()
+        elif self.sort_by == "tags":
+            key_func = lambda a: ", ".join(self.alias_manager.tags.get(a.alias, [])).lower()
+        elif self.sort_by == "uses":
+            key_func = lambda a: self.alias_manager.usage.get(a.alias, (0, None))[0]
+        elif self.sort_by == "last_used":
+            key_func = lambda a: self.alias_manager.usage.get(a.alias, (0, None))[1] or 0
+        elif self.sort_by == "warnings":
+            key_func = lambda a: len(self.alias_warnings(a.alias))
+        elif self.sort_by == "origin":
+            key_func = lambda a: a.origin.lower()
         else:
             key_func = lambda a: a.section.lower()
         aliases_list.sort(key=key_func, reverse=not self.sort_ascending)
@@ -657,18 +2672,15 @@ class AliasManagerApp:
             self.sort_ascending = True
         self.settings['sort_by'] = self.sort_by
         self.settings['sort_ascending'] = self.sort_ascending
-        self.refresh_aliases()
+        self.refresh_aliases(reuse_filter=True)
 
     def on_alias_select(self, event):
-        selected_items = self.alias_tree.selection()
-        if not selected_items:
-            return
-        item = selected_items[0]
-        values = self.alias_tree.item(item, "values")
-        alias_name = values[0]
-        alias = next((a for a in self.alias_manager.aliases if a.alias == alias_name), None)
-        if not alias:
+        selected = self.selected_aliases()
+        if not selected:
             return
+        if len(selected) > 1:
+            self.status_bar.set_message(f"{len(selected)} aliases selected.")
+        alias = selected[0]
         self.alias_var.set(alias.alias)
         self.command_var.set(alias.command)
         self.section_var.set(alias.section)
@@ -676,22 +2688,24 @@ class AliasManagerApp:
         self.description_text.insert("1.0", alias.description)
 
     def on_alias_double_click(self, event):
-        selected_items = self.alias_tree.selection()
-        if not selected_items:
-            return
-        item = selected_items[0]
-        values = self.alias_tree.item(item, "values")
-        alias_name = values[0]
-        alias = next((a for a in self.alias_manager.aliases if a.alias == alias_name), None)
-        if not alias:
+        selected = self.selected_aliases()
+        if not selected:
             return
-        AliasDetailDialog(self.root, alias)
+        alias = selected[0]
+        graph = self.alias_manager.dependencies
+        AliasDetailDialog(self.root, alias, graph.dependencies(alias.alias), graph.dependents(alias.alias))
 
     def on_column_resize(self, event):
         self.settings['column_widths']['alias'] = self.alias_tree.column('alias', 'width')
         self.settings['column_widths']['command'] = self.alias_tree.column('command', 'width')
         self.settings['column_widths']['section'] = self.alias_tree.column('section', 'width')
         self.settings['column_widths']['description'] = self.alias_tree.column('description', 'width')
+        self.settings['column_widths']['tags'] = self.alias_tree.column('tags', 'width')
+        self.settings['column_widths']['uses'] = self.alias_tree.column('uses', 'width')
+        self.settings['column_widths']['last_used'] = self.alias_tree.column('last_used', 'width')
+        self.settings['column_widths']['warnings'] = self.alias_tree.column('warnings', 'width')
+        self.settings['column_widths']['origin'] = self.alias_tree.column('origin', 'width')
+        self.settings['column_widths']['#0'] = self.alias_tree.column('#0', 'width')
 
     def on_window_configure(self, event):
         if event.widget == self.root:
@@ -723,11 +2737,14 @@ class AliasManagerApp:
                     "alias": a.alias,
                     "command": a.command,
                     "section": a.section,
-                    "description": a.description
+                    "description": a.description,
+                    "origin": a.origin,
+                    "read_only": a.read_only
                 }
                 for a in self.alias_manager.aliases
             ],
-            "sections": self.alias_manager.sections.copy()
+            "sections": self.alias_manager.sections.copy(),
+            "tags": {name: list(tags) for name, tags in self.alias_manager.tags.items()}
         }
         self.undo_redo.add_state(state)
         self.update_undo_redo_buttons()
@@ -740,52 +2757,176 @@ class AliasManagerApp:
         if not alias or not command or not section:
             messagebox.showerror("Error", "Alias, command and section are required")
             return
-        self.save_state()
-        selected_items = self.alias_tree.selection()
-        if selected_items:
-            item = selected_items[0]
-            old_alias = self.alias_tree.item(item, "values")[0]
-            if old_alias != alias and any(a.alias == alias for a in self.alias_manager.aliases):
-                messagebox.showerror("Error", f"Alias '{alias}' already exists")
-                return
-            alias_data = AliasData(alias, command, section, description)
-            success = self.alias_manager.update_alias(old_alias, alias_data)
-        else:
+        selected_names = self.selected_alias_names()
+        old_alias = selected_names[0] if selected_names else None
+        if old_alias is not None and self.is_read_only(old_alias):
+            messagebox.showerror("Error", f"Alias '{old_alias}' comes from a read-only source and cannot be edited")
+            return
+        alias_data = AliasData(alias, command, section, description)
+        warnings = []
+        if old_alias != alias:
             if any(a.alias == alias for a in self.alias_manager.aliases):
                 messagebox.showerror("Error", f"Alias '{alias}' already exists")
                 return
-            alias_data = AliasData(alias, command, section, description)
+            warnings.extend(self.alias_manager.check_alias_conflicts(alias, old_alias))
+        warnings.extend(self.alias_manager.validate_aliases([alias_data]).get(alias, []))
+        if warnings and not messagebox.askyesno("Alias Warnings", f"Alias '{alias}' has problems:\n\n" + "\n".join(f"- {w}" for w in warnings) + "\n\nSave anyway?"):
+            return
+        rewrite_dependents = False
+        if old_alias is not None and old_alias != alias:
+            dependents = self.alias_manager.dependents(old_alias)
+            if dependents:
+                choice = messagebox.askyesnocancel("Dependent Aliases", f"Alias '{old_alias}' is used by: {', '.join(dependents)}.\n\nYes - Update them to use '{alias}'\nNo - Rename anyway\nCancel - Keep the old name")
+                if choice is None:
+                    return
+                rewrite_dependents = choice
+        self.save_state()
+        if old_alias is not None:
+            success = self.alias_manager.update_alias(old_alias, alias_data, rewrite_dependents)
+        else:
             success = self.alias_manager.add_alias(alias_data)
         if not success:
             messagebox.showerror("Error", "Failed to save alias")
             return
         self.refresh_aliases()
         self.update_section_dropdown()
-        for item in self.alias_tree.get_children():
-            if self.alias_tree.item(item, "values")[0] == alias:
-                self.alias_tree.selection_set(item)
-                self.alias_tree.see(item)
-                break
+        self.reveal_alias(alias)
         self.status_bar.set_message(f"Alias '{alias}' saved successfully.", "success")
+        self.start_validation()
+
+    def is_read_only(self, alias_name):
+        alias = next((a for a in self.alias_manager.aliases if a.alias == alias_name), None)
+        return alias is not None and alias.read_only
 
     def delete_alias(self):
-        selected_items = self.alias_tree.selection()
-        if not selected_items:
+        selected_names = self.selected_alias_names()
+        if not selected_names:
             messagebox.showerror("Error", "No alias selected")
             return
-        item = selected_items[0]
-        alias_name = self.alias_tree.item(item, "values")[0]
-        confirm = messagebox.askyesno("Confirm Deletion", f"Are you sure you want to delete alias '{alias_name}'?")
-        if not confirm:
+        if len(selected_names) > 1:
+            self.delete_selected(selected_names)
             return
+        alias_name = selected_names[0]
+        if self.is_read_only(alias_name):
+            messagebox.showerror("Error", f"Alias '{alias_name}' comes from a read-only source and cannot be deleted")
+            return
+        dependents = self.alias_manager.dependents(alias_name)
+        inline_dependents = False
+        if dependents:
+            choice = messagebox.askyesnocancel("Confirm Deletion", f"Alias '{alias_name}' is used by: {', '.join(dependents)}.\n\nYes - Delete it and inline its command into those aliases\nNo - Delete it anyway\nCancel - Keep it")
+            if choice is None:
+                return
+            inline_dependents = choice
+        else:
+            confirm = messagebox.askyesno("Confirm Deletion", f"Are you sure you want to delete alias '{alias_name}'?")
+            if not confirm:
+                return
         self.save_state()
-        success = self.alias_manager.delete_alias(alias_name)
+        success = self.alias_manager.delete_alias(alias_name, inline_dependents)
         if not success:
             messagebox.showerror("Error", f"Failed to delete alias '{alias_name}'")
             return
         self.refresh_aliases()
         self.new_alias()
         self.status_bar.set_message(f"Alias '{alias_name}' deleted.", "success")
+        self.start_validation()
+
+    def select_all_aliases(self):
+        if self.settings['grouped_view']:
+            items = [row for section in self.alias_tree.get_children() if self.alias_tree.item(section, "open") for row in self.alias_tree.get_children(section)]
+        else:
+            items = self.alias_tree.get_children()
+        self.alias_tree.selection_set([item for item in items if item in self.item_aliases])
+
+    def run_bulk_action(self, message, action, *args):
+        selected = self.alias_tree.selection()
+        self.save_state()
+        if not action(*args):
+            messagebox.showerror("Error", "Failed to apply the change to the selected aliases")
+            return False
+        self.refresh_aliases()
+        self.alias_tree.selection_set([item for item in selected if self.alias_tree.exists(item)])
+        self.update_section_dropdown()
+        self.status_bar.set_message(message, "success")
+        self.start_validation()
+        return True
+
+    def editable_selection(self, action):
+        names = self.selected_alias_names()
+        if not names:
+            messagebox.showerror("Error", "No alias selected")
+            return []
+        editable = [a.alias for a in self.alias_manager.editable_aliases(names)]
+        if not editable:
+            messagebox.showerror("Error", f"The selected aliases come from read-only sources and cannot be {action}")
+        return editable
+
+    def delete_selected(self, names):
+        editable = [a.alias for a in self.alias_manager.editable_aliases(names)]
+        if not editable:
+            messagebox.showerror("Error", "The selected aliases come from read-only sources and cannot be deleted")
+            return
+        message = f"Are you sure you want to delete {len(editable)} aliases?"
+        outside = sorted({d for name in editable for d in self.alias_manager.dependents(name)} - set(editable))
+        if outside:
+            message += f"\n\nThey are still used by: {', '.join(outside)}"
+        if len(editable) < len(names):
+            message += f"\n\n{len(names) - len(editable)} read-only aliases will be kept."
+        if not messagebox.askyesno("Confirm Deletion", message):
+            return
+        if self.run_bulk_action(f"Deleted {len(editable)} aliases.", self.alias_manager.delete_aliases, editable):
+            self.new_alias()
+
+    def move_selected(self):
+        names = self.editable_selection("moved")
+        if not names:
+            return
+        section = simpledialog.askstring("Move to Section", f"Move {len(names)} aliases to section:", initialvalue=self.section_var.get())
+        if not section or not section.strip():
+            return
+        self.run_bulk_action(f"Moved {len(names)} aliases to '{section.strip()}'.", self.alias_manager.move_aliases, names, section.strip())
+
+    def tag_selected(self):
+        names = self.selected_alias_names()
+        if not names:
+            messagebox.showerror("Error", "No alias selected")
+            return
+        text = simpledialog.askstring("Tag Aliases", f"Tags for {len(names)} aliases, separated by commas.\nPrefix a tag with - to remove it:")
+        if not text:
+            return
+        tags = [t.strip() for t in text.split(",") if t.strip()]
+        add = [t for t in tags if not t.startswith("-")]
+        remove = [t[1:] for t in tags if t.startswith("-")]
+        self.run_bulk_action(f"Tagged {len(names)} aliases.", self.alias_manager.tag_aliases, names, add, remove)
+
+    def replace_in_selected(self):
+        names = self.editable_selection("edited")
+        if not names:
+            return
+        find = simpledialog.askstring("Find and Replace", f"Find in the commands of {len(names)} aliases:")
+        if not find:
+            return
+        replace = simpledialog.askstring("Find and Replace", f"Replace '{find}' with:")
+        if replace is None:
+            return
+        matches = [a for a in self.alias_manager.editable_aliases(names) if find in a.command]
+        if not matches:
+            messagebox.showinfo("Find and Replace", f"'{find}' was not found in the selected aliases")
+            return
+        self.run_bulk_action(f"Replaced '{find}' in {len(matches)} aliases.", self.alias_manager.replace_in_commands, names, find, replace)
+
+    def export_selected(self):
+        names = self.editable_selection("exported")
+        if not names:
+            return
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        default_filename = f"aliases_selection_{timestamp}.json"
+        filepath = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON Files", "*.json")], title="Export Selected Aliases", initialdir=self.alias_manager.backups_dir, initialfile=default_filename)
+        if not filepath:
+            return
+        if self.alias_manager.export_aliases(filepath, names):
+            messagebox.showinfo("Export", f"{len(names)} aliases exported to {filepath}")
+            self.status_bar.set_message("Selected aliases exported successfully.", "success")
 
     def add_section(self):
         section_name = simpledialog.askstring("Add Section", "Enter the name of the new section:")
@@ -871,6 +3012,43 @@ class AliasManagerApp:
             self.update_section_dropdown()
             messagebox.showinfo("Import", "Aliases imported successfully")
             self.status_bar.set_message("Aliases imported successfully.", "success")
+            self.start_validation()
+
+    def sync_with_file(self):
+        filepath = filedialog.askopenfilename(filetypes=[("JSON Files", "*.json")], title="Sync With Export File", initialdir=self.alias_manager.backups_dir)
+        if filepath:
+            self.sync_aliases(filepath)
+
+    def sync_with_directory(self):
+        dirpath = filedialog.askdirectory(title="Sync With Directory", initialdir=self.alias_manager.backups_dir)
+        if dirpath:
+            self.sync_aliases(dirpath)
+
+    def sync_aliases(self, remote_path):
+        plan = self.alias_manager.plan_sync(remote_path)
+        if plan is None:
+            return
+        if not plan["sections"]:
+            self.alias_manager.record_sync_base(plan)
+            messagebox.showinfo("Sync", "Aliases are already in sync.")
+            return
+        TextReportDialog(self.root, "Sync Preview", AliasSync.report(plan))
+        if plan["conflicts"]:
+            take = messagebox.askyesnocancel("Sync Conflicts", f"{len(plan['conflicts'])} aliases were changed on both sides:\n\n" + ", ".join(plan["conflicts"]) + "\n\nYes keeps the local versions, No takes the remote versions, Cancel leaves them untouched.")
+            if take is not None:
+                AliasSync.resolve(plan, "local" if take else "remote")
+        if not plan["pull"] and not plan["push"]:
+            self.alias_manager.record_sync_base(plan)
+            self.status_bar.set_message(f"{len(plan['conflicts'])} aliases were changed on both sides and left untouched.", "warning")
+            return
+        if not messagebox.askyesno("Sync", f"Apply {len(plan['pull'])} incoming and send {len(plan['push'])} outgoing changes?"):
+            return
+        self.save_state()
+        if self.alias_manager.apply_sync(plan):
+            self.refresh_aliases()
+            self.update_section_dropdown()
+            self.status_bar.set_message(f"Synced {len(plan['pull']) + len(plan['push'])} aliases in {len(plan['sections'])} sections.", "success")
+            self.start_validation()
 
     def update_undo_redo_buttons(self):
         if self.undo_redo.can_undo():
@@ -904,13 +3082,22 @@ class AliasManagerApp:
                 alias_data["alias"],
                 alias_data["command"],
                 alias_data["section"],
-                alias_data["description"]
+                alias_data["description"],
+                alias_data.get("origin", ""),
+                alias_data.get("read_only", False)
             ))
             self.alias_manager.descriptions[alias_data["alias"]] = alias_data["description"]
+        self.alias_manager.tags = {name: list(tags) for name, tags in state.get("tags", self.alias_manager.tags).items()}
+        self.alias_manager.dependencies.rebuild(self.alias_manager.aliases)
         self.alias_manager.save_to_bashrc()
         self.alias_manager.save_descriptions()
+        self.alias_manager.save_tags()
         self.refresh_aliases()
         self.update_section_dropdown()
+        self.start_validation()
+
+    def show_conflict_report(self):
+        TextReportDialog(self.root, "Conflict Report", self.alias_manager.conflict_report())
 
     def show_about(self):
         about_text = """
@@ -944,6 +3131,46 @@ F5 - Refresh all
         messagebox.showinfo("Keyboard Shortcuts", shortcuts_text.strip())
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bashrc Alias Manager Toolkit")
+    parser.add_argument("--fleet-scan", metavar="HOME_ROOT", help="scan the .bashrc of every home directory under HOME_ROOT instead of starting the GUI")
+    parser.add_argument("--index-out", metavar="FILE", help="write the merged alias index of a fleet scan to FILE")
+    parser.add_argument("--patch", metavar="PATCH_JSON", help='apply a patch set {"set": [{"alias", "command", "section"}], "delete": [alias]} to every scanned file')
+    parser.add_argument("--workers", type=int, help="number of worker processes for fleet operations")
+    parser.add_argument("--descriptions-name", metavar="NAME", help="per-home alias descriptions file to include in the index")
+    parser.add_argument("--lock-timeout", type=float, default=5.0, help="seconds to wait for a locked .bashrc before skipping it")
+    args = parser.parse_args()
+    if args.fleet_scan:
+        def print_progress(label, done, total, files_per_second, bytes_per_second):
+            print(f"\r{label}: {done}/{total} files, {files_per_second:.0f} files/s, {bytes_per_second / 1048576:.1f} MiB/s", end="", file=sys.stderr)
+            if done == total:
+                print(file=sys.stderr)
+        scanner = FleetScanner(args.workers, descriptions_name=args.descriptions_name, progress=print_progress, lock_timeout=args.lock_timeout)
+        homes = scanner.discover(args.fleet_scan)
+        index, results = scanner.scan(homes)
+        for result in results:
+            if result["error"]:
+                print(f"{result['path']}: {result['error']}", file=sys.stderr)
+        if args.index_out:
+            with open(args.index_out, 'w') as f:
+                json.dump(index, f, indent=4)
+        else:
+            for name in sorted(index):
+                entry = index[name]
+                print(f"{name}: {len(entry['users'])} users, {len(entry['commands'])} commands, sections: {', '.join(entry['sections'])}")
+        if args.patch:
+            with open(args.patch, 'r') as f:
+                patch = json.load(f)
+            patch_results = scanner.apply_patch(homes, patch)
+            for result in patch_results:
+                if result["error"]:
+                    print(f"{result['path']}: {result['error']}", file=sys.stderr)
+            print(f"Patched {sum(1 for r in patch_results if r['changed'])} of {len(patch_results)} files.", file=sys.stderr)
+        for label, stats in scanner.stats.items():
+            print(f"{label}: {stats['files']} files ({stats['errors']} errors) in {stats['seconds']:.2f}s, {stats['files_per_second']:.0f} files/s", file=sys.stderr)
+        sys.exit(1 if any(stats["errors"] for stats in scanner.stats.values()) else 0)
+    if not HAS_TKINTER:
+        print("Error: tkinter is not installed; only the --fleet-scan mode is available", file=sys.stderr)
+        sys.exit(1)
     root = tk.Tk()
     app = AliasManagerApp(root)
     root.mainloop()
@@ -0,0 +1,571 @@
+import argparse
+import heapq
+import json
+import math
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tkinter
+import tkinter.constants
+from types import SimpleNamespace
+
+import alias_manager_toolkit as toolkit
+
+COMMAND_TEMPLATES = (
+    "git status --short {name}",
+    "ls -la /srv/{name}",
+    "docker compose -f /opt/{name}/compose.yml up -d",
+    "kubectl get pods -n {name} -o wide",
+    "ssh deploy@{name}.example.com",
+    "grep -rn {name} /var/log",
+    "cd ~/projects/{name} && make test",
+    "echo {name} | tr a-z A-Z",
+)
+
+DEFAULT_SIZES = "1000,10000,100000"
+
+class StubWidget:
+    def __init__(self, *args, **kwargs):
+        self.options = dict(kwargs)
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return self.noop
+
+    def noop(self, *args, **kwargs):
+        return None
+
+    def __setitem__(self, key, value):
+        self.options[key] = value
+
+    def __getitem__(self, key):
+        return self.options.get(key)
+
+class StubVar:
+    def __init__(self, master=None, value=None, name=None):
+        self.value = value
+        self.callbacks = []
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+        for callback in self.callbacks:
+            callback("", "", "write")
+
+    def trace(self, mode, callback):
+        self.callbacks.append(callback)
+
+    trace_add = trace
+
+class StubStringVar(StubVar):
+    def __init__(self, master=None, value="", name=None):
+        super().__init__(master, value, name)
+
+class StubBooleanVar(StubVar):
+    def __init__(self, master=None, value=False, name=None):
+        super().__init__(master, value, name)
+
+class StubText(StubWidget):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.text = ""
+
+    def get(self, start, end=None):
+        return self.text + "\n"
+
+    def delete(self, start, end=None):
+        self.text = ""
+
+    def insert(self, index, text):
+        self.text += text
+
+class StubTreeview(StubWidget):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.nodes = {"": {"children": [], "parent": None, "text": "", "open": True, "values": (), "tags": ()}}
+        self.widths = {}
+        self.selected = ()
+        self.focused = ""
+
+    def insert(self, parent, index, iid=None, text="", values=(), tags=(), open=False):
+        if iid is None:
+            iid = f"I{len(self.nodes)}"
+        if iid in self.nodes:
+            raise tkinter.TclError(f"Item {iid} already exists")
+        self.nodes[iid] = {"children": [], "parent": parent, "text": text, "open": open, "values": tuple(values), "tags": tuple(tags)}
+        children = self.nodes[parent]["children"]
+        if index == tkinter.END:
+            children.append(iid)
+        else:
+            children.insert(index, iid)
+        return iid
+
+    def delete(self, *items):
+        for item in items:
+            if item not in self.nodes:
+                continue
+            for child in list(self.nodes[item]["children"]):
+                self.delete(child)
+            self.nodes[self.nodes[item]["parent"]]["children"].remove(item)
+            del self.nodes[item]
+        self.selected = tuple(item for item in self.selected if item in self.nodes)
+
+    def exists(self, item):
+        return item in self.nodes
+
+    def get_children(self, item=""):
+        return tuple(self.nodes[item]["children"])
+
+    def parent(self, item):
+        return self.nodes[item]["parent"]
+
+    def move(self, item, parent, index):
+        self.nodes[self.nodes[item]["parent"]]["children"].remove(item)
+        self.nodes[parent]["children"].insert(index, item)
+        self.nodes[item]["parent"] = parent
+
+    def item(self, item, option=None, **kwargs):
+        if kwargs:
+            self.nodes[item].update(kwargs)
+            return None
+        if option is None:
+            return dict(self.nodes[item])
+        return self.nodes[item][option]
+
+    def column(self, column, option=None, **kwargs):
+        if "width" in kwargs:
+            self.widths[column] = kwargs["width"]
+        if option == "width":
+            return self.widths.get(column, 100)
+        return None
+
+    def focus(self, item=None):
+        if item is None:
+            return self.focused
+        self.focused = item
+        return None
+
+    def selection(self):
+        return self.selected
+
+    def selection_set(self, items):
+        self.selected = tuple(items) if isinstance(items, (list, tuple)) else (items,)
+
+    def selection_remove(self, *items):
+        self.selected = tuple(item for item in self.selected if item not in items)
+
+class StubRoot(StubWidget):
+    def __init__(self):
+        super().__init__()
+        self.queue = []
+        self.counter = 0
+        self.running = False
+
+    def after(self, ms, func=None, *args):
+        self.counter += 1
+        heapq.heappush(self.queue, (time.perf_counter() + ms / 1000.0, self.counter, func, args))
+        return f"after#{self.counter}"
+
+    def after_cancel(self, after_id):
+        self.queue = [entry for entry in self.queue if f"after#{entry[1]}" != after_id]
+        heapq.heapify(self.queue)
+
+    def mainloop(self):
+        self.running = True
+        while self.running and self.queue:
+            due, _, func, args = heapq.heappop(self.queue)
+            delay = due - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            func(*args)
+
+    def quit(self):
+        self.running = False
+
+    def destroy(self):
+        self.running = False
+
+    def geometry(self, value=None):
+        return "900x700+100+100"
+
+def stub_modules():
+    constants = {name: value for name, value in vars(tkinter.constants).items() if name.isupper()}
+    tk = SimpleNamespace(Tk=StubRoot, Toplevel=StubWidget, Menu=StubWidget, Text=StubText, StringVar=StubStringVar, BooleanVar=StubBooleanVar, TclError=tkinter.TclError, **constants)
+    ttk = SimpleNamespace(Treeview=StubTreeview, Style=StubWidget, Frame=StubWidget, LabelFrame=StubWidget, Label=StubWidget, Entry=StubWidget, Button=StubWidget, Checkbutton=StubWidget, Combobox=StubWidget, Scrollbar=StubWidget, PanedWindow=StubWidget, Separator=StubWidget)
+    return tk, ttk
+
+class ScriptedDialogs:
+    def __init__(self):
+        self.answers = []
+        self.messages = []
+
+    def answer(self, *answers):
+        self.answers.extend(answers)
+
+    def askstring(self, title, prompt, **kwargs):
+        return self.answers.pop(0) if self.answers else None
+
+    def askyesno(self, title, message, **kwargs):
+        return True
+
+    def askyesnocancel(self, title, message, **kwargs):
+        return True
+
+    def show(self, title, message, **kwargs):
+        self.messages.append((title, message))
+
+    showinfo = showerror = showwarning = show
+
+    def asksaveasfilename(self, **kwargs):
+        return self.answers.pop(0) if self.answers else ""
+
+    askopenfilename = asksaveasfilename
+
+class HarnessApp(toolkit.AliasManagerApp):
+    def __init__(self, root, alias_manager, history_path, background=True):
+        self.history_path = history_path
+        self.background = background
+        super().__init__(root, alias_manager)
+
+    def history_paths(self):
+        return [self.history_path]
+
+    def start_history_analysis(self):
+        if self.background:
+            super().start_history_analysis()
+
+    def start_validation(self):
+        if self.background:
+            super().start_validation()
+
+class VirtualDisplay:
+    def __init__(self):
+        self.process = None
+        self.previous = os.environ.get("DISPLAY")
+
+    def start(self):
+        xvfb = shutil.which("Xvfb")
+        if not xvfb:
+            return False
+        number = next(n for n in range(99, 200) if not os.path.exists(f"/tmp/.X{n}-lock"))
+        self.process = subprocess.Popen([xvfb, f":{number}", "-screen", "0", "1280x1024x24", "-nolisten", "tcp"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        deadline = time.monotonic() + 10
+        while not os.path.exists(f"/tmp/.X11-unix/X{number}"):
+            if self.process.poll() is not None or time.monotonic() > deadline:
+                self.stop()
+                return False
+            time.sleep(0.05)
+        os.environ["DISPLAY"] = f":{number}"
+        return True
+
+    def stop(self):
+        if self.process:
+            self.process.terminate()
+            self.process.wait()
+            self.process = None
+        if self.previous is None:
+            os.environ.pop("DISPLAY", None)
+        else:
+            os.environ["DISPLAY"] = self.previous
+
+class Fixture:
+    def __init__(self, size, seed=0):
+        self.size = size
+        self.random = random.Random(seed)
+        self.dir = tempfile.mkdtemp(prefix=f"alias_perf_{size}_")
+        self.bashrc_path = os.path.join(self.dir, ".bashrc")
+        self.history_path = os.path.join(self.dir, ".bash_history")
+        self.sections = [f"Section {i:03d}" for i in range(max(10, size // 200))]
+
+    def write(self):
+        by_section = {}
+        descriptions = {}
+        history = []
+        for i in range(self.size):
+            name = f"{self.random.choice(('g', 'k', 'd', 'go', 'ls', 'ssh'))}{i}"
+            command = self.random.choice(COMMAND_TEMPLATES).format(name=f"svc{i % 997}")
+            by_section.setdefault(self.random.choice(self.sections), []).append(toolkit.AliasData(name, command, "", ""))
+            if i % 3 == 0:
+                descriptions[name] = f"Shortcut number {i} for svc{i % 997}"
+            history.append(f"{name}\n" if i % 2 else f"{command}\n")
+        lines = ["# ~/.bashrc\n", "export PATH=$HOME/bin:$PATH\n", "\n", "# CUSTOM ALIASES\n", "\n"]
+        for section in sorted(by_section):
+            lines.append(f"# {section}\n")
+            lines.extend(toolkit.AliasManager.render_alias(a) + "\n" for a in by_section[section])
+            lines.append("\n")
+        with open(self.bashrc_path, 'w') as f:
+            f.writelines(lines)
+        with open(os.path.join(self.dir, "alias_descriptions.json"), 'w') as f:
+            json.dump(descriptions, f)
+        self.random.shuffle(history)
+        with open(self.history_path, 'w') as f:
+            f.writelines(history)
+
+    def alias_manager(self):
+        return toolkit.AliasManager(self.bashrc_path, os.path.join(self.dir, "alias_descriptions.json"), extra_sources=[], data_dir=self.dir)
+
+    def cleanup(self):
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+class SessionDriver:
+    def __init__(self, root, heartbeat_ms=10, think_ms=2, idle=None):
+        self.root = root
+        self.heartbeat_ms = heartbeat_ms
+        self.think_ms = think_ms
+        self.idle = idle or (lambda: None)
+        self.steps = []
+        self.latencies = {}
+        self.stalls = []
+        self.last_beat = None
+        self.finished = False
+
+    def add(self, kind, action, *args):
+        self.steps.append((kind, action, args))
+
+    def heartbeat(self):
+        now = time.perf_counter()
+        if self.last_beat is not None:
+            self.stalls.append(max(0.0, (now - self.last_beat) * 1000 - self.heartbeat_ms))
+        self.last_beat = now
+        if not self.finished:
+            self.root.after(self.heartbeat_ms, self.heartbeat)
+
+    def run_step(self, index):
+        if index >= len(self.steps):
+            self.finished = True
+            self.root.after(self.heartbeat_ms * 2, self.root.quit)
+            return
+        kind, action, args = self.steps[index]
+        started = time.perf_counter()
+        action(*args)
+        self.idle()
+        self.latencies.setdefault(kind, []).append((time.perf_counter() - started) * 1000)
+        self.root.after(self.think_ms, self.run_step, index + 1)
+
+    def run(self):
+        self.root.after(0, self.heartbeat)
+        self.root.after(self.heartbeat_ms, self.run_step, 0)
+        self.root.mainloop()
+
+class PerfHarness:
+    def __init__(self, mode="auto", view="grouped", query="svc12 up", heartbeat_ms=10, undo_depth=5, seed=0, background=True):
+        self.mode = mode
+        self.background = background
+        self.view = view
+        self.query = query
+        self.heartbeat_ms = heartbeat_ms
+        self.undo_depth = undo_depth
+        self.seed = seed
+        self.display = None
+        self.dialogs = ScriptedDialogs()
+
+    def setup(self):
+        toolkit.messagebox = self.dialogs
+        toolkit.simpledialog = self.dialogs
+        toolkit.filedialog = self.dialogs
+        if self.mode == "auto":
+            if os.environ.get("DISPLAY"):
+                self.mode = "tk"
+            else:
+                self.display = VirtualDisplay()
+                self.mode = "tk" if self.display.start() else "stub"
+        elif self.mode == "xvfb":
+            self.display = VirtualDisplay()
+            if not self.display.start():
+                raise RuntimeError("Xvfb is not available")
+            self.mode = "tk"
+        if self.mode == "stub":
+            toolkit.tk, toolkit.ttk = stub_modules()
+            toolkit.StatusBar = StubWidget
+
+    def teardown(self):
+        if self.display:
+            self.display.stop()
+
+    def create_root(self):
+        if self.mode == "stub":
+            return StubRoot()
+        root = tkinter.Tk()
+        root.geometry("1200x800+0+0")
+        return root
+
+    def run_size(self, size):
+        fixture = Fixture(size, self.seed)
+        fixture.write()
+        root = self.create_root()
+        try:
+            started = time.perf_counter()
+            manager = fixture.alias_manager()
+            load_ms = (time.perf_counter() - started) * 1000
+            with open(manager.settings_path, 'wb') as f:
+                toolkit.pickle.dump({'grouped_view': self.view == "grouped"}, f)
+            idle = root.update_idletasks if self.mode == "tk" else None
+            started = time.perf_counter()
+            app = HarnessApp(root, manager, fixture.history_path, self.background)
+            if idle:
+                root.update()
+            startup_ms = (time.perf_counter() - started) * 1000
+            driver = SessionDriver(root, self.heartbeat_ms, idle=idle)
+            self.script_session(driver, app, fixture)
+            driver.run()
+            driver.latencies["load"] = [load_ms]
+            driver.latencies["startup"] = [startup_ms]
+            return {"size": size, "mode": self.mode, "view": self.view, "background": self.background, "latencies": driver.latencies, "stalls": driver.stalls}
+        finally:
+            try:
+                root.destroy()
+            except tkinter.TclError:
+                pass
+            fixture.cleanup()
+
+    def script_session(self, driver, app, fixture):
+        for i in range(1, len(self.query) + 1):
+            driver.add("type", app.search_var.set, self.query[:i])
+        for i in range(len(self.query) - 1, -1, -1):
+            driver.add("type", app.search_var.set, self.query[:i])
+        for column in ("command", "uses", "section", "section", "alias"):
+            driver.add("sort", app.sort_treeview, column)
+        for section in fixture.sections[:3]:
+            driver.add("expand", self.expand_section, app, section)
+        section = fixture.sections[0]
+        driver.add("filter", self.filter_section, app, section)
+        driver.add("select", self.select_section, app, section)
+        driver.add("bulk", self.bulk_action, app.tag_selected, "perf, bulk")
+        driver.add("bulk", self.bulk_action, app.replace_in_selected, "svc", "service")
+        driver.add("bulk", self.bulk_action, app.move_selected, "Perf Moved")
+        driver.add("filter", self.filter_section, app, "All")
+        for i in range(self.undo_depth):
+            driver.add("save", self.edit_alias, app, i)
+        for _ in range(self.undo_depth + 3):
+            driver.add("undo", app.undo_action)
+        for _ in range(self.undo_depth + 3):
+            driver.add("redo", app.redo_action)
+
+    def expand_section(self, app, section):
+        item = f"section:{section}"
+        if not app.alias_tree.exists(item):
+            return
+        app.alias_tree.item(item, open=True)
+        app.alias_tree.focus(item)
+        app.on_section_open(None)
+
+    def filter_section(self, app, section):
+        app.section_filter_var.set(section)
+        app.filter_aliases()
+
+    def select_section(self, app, section):
+        self.expand_section(app, section)
+        app.select_all_aliases()
+
+    def bulk_action(self, action, *answers):
+        self.dialogs.answer(*answers)
+        action()
+        self.dialogs.answers.clear()
+
+    def edit_alias(self, app, index):
+        alias = app.alias_manager.managed_aliases()[index]
+        app.reveal_alias(alias.alias)
+        if app.selected_alias_names() != [alias.alias]:
+            app.alias_tree.selection_set(app.alias_item(alias))
+        app.alias_var.set(alias.alias)
+        app.command_var.set(alias.command + " --verbose")
+        app.section_var.set(alias.section)
+        app.description_text.delete("1.0", toolkit.tk.END)
+        app.description_text.insert("1.0", alias.description)
+        app.save_alias()
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+def summarize(result):
+    summary = {}
+    for kind, values in result["latencies"].items():
+        summary[kind] = {"count": len(values), "p50": percentile(values, 0.50), "p95": percentile(values, 0.95), "p99": percentile(values, 0.99), "max": max(values)}
+    stalls = result["stalls"] or [0.0]
+    summary["stall"] = {"count": sum(1 for s in stalls if s >= 50), "p50": percentile(stalls, 0.50), "p95": percentile(stalls, 0.95), "p99": percentile(stalls, 0.99), "max": max(stalls)}
+    return summary
+
+def load_budgets(budget_file, budget_args):
+    budgets = {}
+    if budget_file:
+        with open(budget_file, 'r') as f:
+            budgets = json.load(f)
+    for item in budget_args or []:
+        key, _, value = item.partition("=")
+        budgets[key.strip()] = float(value)
+    return budgets
+
+def budgets_for(budgets, size):
+    limits = {key: value for key, value in budgets.items() if not isinstance(value, dict)}
+    limits.update(budgets.get(str(size), {}))
+    return limits
+
+def check_budgets(summary, limits):
+    violations = []
+    for key, limit in limits.items():
+        kind, _, metric = key.partition(".")
+        value = summary.get(kind, {}).get(metric or "p95")
+        if value is None or value <= limit:
+            continue
+        if metric == "count":
+            violations.append(f"{key} = {value} exceeds budget {limit:g}")
+        else:
+            violations.append(f"{key} = {value:.1f} ms exceeds budget {limit:.1f} ms")
+    return violations
+
+def print_summary(result, summary):
+    background = "" if result["background"] else ", no background tasks"
+    print(f"\n{result['size']} aliases ({result['mode']}, {result['view']} view{background})")
+    print(f"  {'event':<10}{'count':>7}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}")
+    for kind, stats in summary.items():
+        print(f"  {kind:<10}{stats['count']:>7}{stats['p50']:>10.1f}{stats['p95']:>10.1f}{stats['p99']:>10.1f}{stats['max']:>10.1f}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay scripted GUI sessions against generated alias sets and report latencies")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help=f"comma separated alias counts (default {DEFAULT_SIZES})")
+    parser.add_argument("--mode", choices=("auto", "tk", "xvfb", "stub"), default="auto", help="use the current display, start Xvfb, or replace Tk with stub widgets (auto picks the first that works)")
+    parser.add_argument("--view", choices=("grouped", "flat"), default="grouped", help="alias list view to measure")
+    parser.add_argument("--query", default="svc12 up", help="search text typed one character at a time")
+    parser.add_argument("--undo-depth", type=int, default=5, help="number of single edits followed by an undo/redo chain")
+    parser.add_argument("--heartbeat", type=int, default=10, help="main-loop heartbeat interval in ms used to measure stalls")
+    parser.add_argument("--no-background", action="store_true", help="skip history analysis and validation so only the scripted steps run on the main loop")
+    parser.add_argument("--budget", action="append", metavar="EVENT.METRIC=MS", help="fail if e.g. type.p95 or stall.max exceeds MS, or stall.count exceeds a number of stalls; may be repeated")
+    parser.add_argument("--budget-file", metavar="JSON", help='budgets as {"type.p95": 50, "100000": {"type.p95": 200}}')
+    parser.add_argument("--json-out", metavar="FILE", help="write the raw latencies and summaries to FILE")
+    parser.add_argument("--seed", type=int, default=0, help="random seed for the generated fixtures")
+    args = parser.parse_args()
+    budgets = load_budgets(args.budget_file, args.budget)
+    harness = PerfHarness(args.mode, args.view, args.query, args.heartbeat, args.undo_depth, args.seed, not args.no_background)
+    try:
+        harness.setup()
+    except RuntimeError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(2)
+    report = []
+    violations = []
+    try:
+        for size in [int(s) for s in args.sizes.split(",") if s.strip()]:
+            result = harness.run_size(size)
+            summary = summarize(result)
+            print_summary(result, summary)
+            failed = check_budgets(summary, budgets_for(budgets, size))
+            violations.extend(f"{size}: {v}" for v in failed)
+            report.append(dict(result, summary=summary, violations=failed))
+    finally:
+        harness.teardown()
+    if args.json_out:
+        with open(args.json_out, 'w') as f:
+            json.dump(report, f, indent=4)
+    if violations:
+        print("\nBudget exceeded:")
+        for violation in violations:
+            print(f"  {violation}")
+        sys.exit(1)